@@ -10,14 +10,9 @@ This demo showcases all advanced graph patterns:
 5. State management across supersteps
 """
 
-import os
+import logging
 import sys
-
-sys.path.insert(
-    0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "src"))
-)
-
-import time
+from time import time as _time
 
 from lite_workflow.core.error_handler import ErrorHandler
 from lite_workflow.core.state_manager import StateManager
@@ -28,24 +23,26 @@ from lite_workflow.definitions.graph import Graph
 from lite_workflow.definitions.node import create_function_node
 from lite_workflow.engine.pregel_engine import PregelEngine
 
+_log = logging.getLogger(__name__)
+
 # 🎯 Node Implementations
 
 
 def initial_processor(inputs: dict) -> dict:
     """Process initial input and prepare for fan-out."""
     prompt = inputs.get("prompt", "Explain machine learning to a 10-year-old")
-    print(f"📝 [开始] 处理: {prompt}")
+    _log.debug("📝 [开始] 处理: %s", prompt)
     return {
         "original_prompt": prompt,
         "processed_prompt": prompt.strip(),
-        "timestamp": time.time(),
+        "timestamp": _time(),
     }
 
 
 def parallel_processor_a(inputs: dict) -> dict:
     """First parallel processing branch."""
     prompt = inputs.get("processed_prompt", "")
-    print("🔍 [分支 A] 处理分支 A")
+    _log.debug("🔍 [分支 A] 处理分支 A")
     return {
         "branch_a": f"分支 A 分析: {prompt[:50]}...",
         "complexity_score": len(prompt) // 10,
@@ -55,7 +52,7 @@ def parallel_processor_a(inputs: dict) -> dict:
 def parallel_processor_b(inputs: dict) -> dict:
     """Second parallel processing branch."""
     prompt = inputs.get("processed_prompt", "")
-    print("🎨 [分支 B] 处理分支 B")
+    _log.debug("🎨 [分支 B] 处理分支 B")
     return {
         "branch_b": f"分支 B 创意: {prompt[:50]}...",
         "creativity_score": len(prompt) // 5,
@@ -65,7 +62,7 @@ def parallel_processor_b(inputs: dict) -> dict:
 def parallel_processor_c(inputs: dict) -> dict:
     """Third parallel processing branch."""
     prompt = inputs.get("processed_prompt", "")
-    print("⚡ [分支 C] 处理分支 C")
+    _log.debug("⚡ [分支 C] 处理分支 C")
     return {
         "branch_c": f"分支 C 技术: {prompt[:50]}...",
         "technical_score": len(prompt) // 8,
@@ -74,7 +71,7 @@ def parallel_processor_c(inputs: dict) -> dict:
 
 def fan_in_aggregator(inputs: dict) -> dict:
     """Aggregate results from all parallel branches."""
-    print("🎯 [聚合] 聚合并行结果")
+    _log.debug("🎯 [聚合] 聚合并行结果")
 
     # Collect all branch results
     branches = {}
@@ -82,33 +79,48 @@ def fan_in_aggregator(inputs: dict) -> dict:
         if key.startswith("branch_"):
             branches[key] = value
 
-    scores = {
-        "complexity": inputs.get("complexity_score", 0),
-        "creativity": inputs.get("creativity_score", 0),
-        "technical": inputs.get("technical_score", 0),
-    }
+    # Scores are (complexity, creativity, technical)
+    scores = (
+        inputs.get("complexity_score", 0),
+        inputs.get("creativity_score", 0),
+        inputs.get("technical_score", 0),
+    )
 
     aggregated = {
         "branches": branches,
         "scores": scores,
-        "total_score": sum(scores.values()),
+        "total_score": sum(scores),
         "quality_threshold": 50,
     }
 
-    print(f"   已聚合 {len(branches)} 个分支，总分: {aggregated['total_score']}")
+    _log.debug(
+        "   已聚合 %d 个分支，总分: %s", len(branches), aggregated["total_score"]
+    )
     return aggregated
 
 
+def _gate_core(total_score: int, threshold: int, iteration: int) -> tuple:
+    """Return (meets_quality, should_continue) for the quality gate."""
+    meets_quality = total_score >= threshold
+    return meets_quality, iteration < 3 and not meets_quality  # Max 3 iterations
+
+
+def _improve_core(iteration: int) -> tuple:
+    """Return the improved (complexity, creativity, technical) scores."""
+    return 15 + iteration * 5, 20 + iteration * 8, 12 + iteration * 6
+
+
 def quality_gate(inputs: dict) -> dict:
     """Check if quality meets threshold and decide if loop continues."""
     total_score = inputs.get("total_score", 0)
     threshold = inputs.get("quality_threshold", 50)
     iteration = inputs.get("iteration", 0)
 
-    meets_quality = total_score >= threshold
-    should_continue = iteration < 3 and not meets_quality  # Max 3 iterations
+    meets_quality, should_continue = _gate_core(total_score, threshold, iteration)
 
-    print(f"⚖️ [质量门] 得分: {total_score}/{threshold}, 继续: {should_continue}")
+    _log.debug(
+        "⚖️ [质量门] 得分: %s/%s, 继续: %s", total_score, threshold, should_continue
+    )
 
     return {
         "meets_quality": meets_quality,
@@ -121,23 +133,18 @@ def quality_gate(inputs: dict) -> dict:
 def improvement_engine(inputs: dict) -> dict:
     """Improve the content quality."""
     iteration = inputs.get("iteration", 0)
-    branches = inputs.get("branches", {})
 
-    print(f"🔧 [改进] 提升质量 (迭代 {iteration + 1})")
+    _log.debug("🔧 [改进] 提升质量 (迭代 %d)", iteration + 1)
 
-    # Simulate improvement by increasing scores
+    # Simulate improvement by increasing scores; the branch texts are marked
+    # once in final_renderer rather than rebuilt on every iteration
     improved = {
-        "branches": {k: v + " [IMPROVED]" for k, v in branches.items()},
-        "scores": {
-            "complexity": 15 + iteration * 5,
-            "creativity": 20 + iteration * 8,
-            "technical": 12 + iteration * 6,
-        },
+        "scores": _improve_core(iteration),
         "iteration": iteration + 1,
         "quality_threshold": 50,
     }
 
-    improved["total_score"] = sum(improved["scores"].values())
+    improved["total_score"] = sum(improved["scores"])
     return improved
 
 
@@ -147,7 +154,11 @@ def final_renderer(inputs: dict) -> dict:
     total_score = inputs.get("total_score", 0)
     iteration = inputs.get("iteration", 0)
 
-    print("🎉 [完成] 渲染完成内容")
+    _log.debug("🎉 [完成] 渲染完成内容")
+
+    if iteration:
+        suffix = " [IMPROVED]" * iteration
+        branches = {k: v + suffix for k, v in branches.items()}
 
     final_content = {
         "final_output": {
@@ -160,7 +171,7 @@ def final_renderer(inputs: dict) -> dict:
         "metadata": {
             "process_complete": True,
             "quality_achieved": total_score >= 50,
-            "execution_time": time.time(),
+            "execution_time": _time(),
         },
     }
 
@@ -244,9 +255,9 @@ def run_comprehensive_demo():
     print(f"初始状态: {initial_state}")
 
     # Execute
-    start_time = time.time()
+    start_time = _time()
     final_state = engine.execute()
-    execution_time = time.time() - start_time
+    execution_time = _time() - start_time
 
     # Results
     print("\n🎉 执行完成!")
@@ -345,6 +356,12 @@ async def run_async_demo():
 
 
 if __name__ == "__main__":
+    # Show the per-node trace when run as a script; importers stay quiet
+    _handler = logging.StreamHandler(sys.stdout)
+    _handler.setFormatter(logging.Formatter("%(message)s"))
+    _log.addHandler(_handler)
+    _log.setLevel(logging.DEBUG)
+
     # Run comprehensive demo
     result = run_comprehensive_demo()
 
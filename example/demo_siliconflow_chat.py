@@ -2,6 +2,7 @@ import asyncio
 import os
 import sys
 import time
+from functools import lru_cache
 
 # 确保能导入 lite_workflow 模块
 sys.path.insert(
@@ -19,6 +20,12 @@ from lite_workflow.engine.pregel_engine import PregelEngine
 # 节点实现
 
 
+@lru_cache(maxsize=16)
+def _get_model(model: str, api_key: str):
+    """按 (模型, API KEY) 复用模型实例，避免每次调用都重建 HTTP 客户端。"""
+    return ChatSiliconFlow(model=model, api_key=api_key)
+
+
 def initial_prompt_node(inputs: dict) -> dict:
     """处理初始输入并准备好进行大模型调用。"""
     prompt = inputs.get("prompt", "请用中文简洁介绍一下机器学习。")
@@ -43,7 +50,7 @@ async def silicon_flow_chat_node(inputs: dict) -> dict:
 
     try:
         print("🚀 [硅基流动] 正在创建模型实例...")
-        model = ChatSiliconFlow(model="Qwen/Qwen3-8B", api_key=api_key)
+        model = _get_model("Qwen/Qwen3-8B", api_key)
         print("✅ [硅基流动] 模型实例创建成功")
 
         print("📤 [硅基流动] 正在调用模型...")
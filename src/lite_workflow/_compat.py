@@ -0,0 +1,25 @@
+"""
+Interpreter compatibility helpers.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import sys
+
+# ``@dataclass(slots=True)`` is only available from Python 3.10 onwards
+DATACLASS_SLOTS: dict[str, bool] = (
+    {"slots": True} if sys.version_info >= (3, 10) else {}
+)
+
+# Eager tasks (Python 3.12+) run a new task synchronously until its first
+# suspension, so coroutines that never block skip an event-loop round-trip
+EAGER_TASK_FACTORY = getattr(asyncio, "eager_task_factory", None)
+
+# ``asyncio.Runner`` (Python 3.11+) lets a task factory be set on the loop
+# before the main coroutine starts
+ASYNCIO_RUNNER = getattr(asyncio, "Runner", None)
+
+# ``asyncio.TaskGroup`` (Python 3.11+) tracks its tasks with less per-task
+# bookkeeping than ``gather``/``as_completed``
+TASK_GROUP = getattr(asyncio, "TaskGroup", None)
@@ -46,7 +46,8 @@ def run_demo():
 
     print("=== Workflow Demo ===")
     print(f"Success: {result.success}")
-    print(f"Final Result: {result.final_state.to_dict().get('final_result', 'N/A')}")
+    final_data = result.final_state.to_dict() if result.final_state else {}
+    print(f"Final Result: {final_data.get('final_result', 'N/A')}")
     print(f"Execution Stats: {result.execution_stats}")
 
 
@@ -11,9 +11,7 @@ from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from typing import Any, AsyncIterator, Iterator
 
-import openai
-
-from ..definitions.message import ChatResult, Message
+from ..definitions.message import ChatResult, Message, messages_to_payload
 
 
 class BaseChatModel(ABC):
@@ -88,6 +86,10 @@ class OpenAIChatModel(BaseChatModel):
         max_tokens: int | None = None,
         **kwargs: Any,
     ):
+        # Imported here: the openai SDK is slow to import and only needed
+        # once a model is actually constructed
+        import openai
+
         self.client = openai.OpenAI(
             api_key=api_key,
             base_url=base_url,
@@ -101,7 +103,7 @@ class OpenAIChatModel(BaseChatModel):
         """Convert various input formats to OpenAI format."""
         if isinstance(messages, str):
             return [{"role": "user", "content": messages}]
-        return [msg.to_dict() for msg in messages]
+        return messages_to_payload(messages)
 
     def _create_params(
         self, messages: list[dict[str, Any]], **kwargs: Any
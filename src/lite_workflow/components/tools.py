@@ -16,6 +16,7 @@ from typing import Any, Callable, Type
 
 from typing_extensions import TypeAlias
 
+from .._compat import DATACLASS_SLOTS, TASK_GROUP
 from ..core.logger import Logger
 from ..definitions.node import Node
 
@@ -43,7 +44,7 @@ class ToolValidationError(ToolError):
     pass
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class ToolSchema:
     """Schema definition for a tool."""
 
@@ -71,6 +72,8 @@ class ToolSchema:
 class BaseTool(ABC):
     """Abstract base class for all tools."""
 
+    __slots__ = ("name", "description", "schema", "logger")
+
     def __init__(
         self,
         name: str,
@@ -103,25 +106,28 @@ class BaseTool(ABC):
             required=[],
         )
 
-    def run(self, *args: Any, **kwargs: Any) -> str:
-        """Run the tool with validation."""
+    def run(self, **kwargs: Any) -> str:
+        """Run the tool with validation.
+
+        Tools take keyword arguments only, matching their JSON schema.
+        """
         try:
-            return self._run(*args, **kwargs)
+            return self._run(**kwargs)
         except Exception as e:
-            self.logger.error(f"Tool {self.name} execution failed: {e}")
+            self.logger.error("Tool %s execution failed: %s", self.name, e)
             raise ToolExecutionError(f"Tool {self.name} failed: {e}") from e
 
-    async def arun(self, *args: Any, **kwargs: Any) -> str:
+    async def arun(self, **kwargs: Any) -> str:
         """Run the tool asynchronously with validation."""
         try:
-            return await self._arun(*args, **kwargs)
+            return await self._arun(**kwargs)
         except Exception as e:
-            self.logger.error(f"Async tool {self.name} execution failed: {e}")
+            self.logger.error("Async tool %s execution failed: %s", self.name, e)
             raise ToolExecutionError(f"Async tool {self.name} failed: {e}") from e
 
-    def __call__(self, *args: Any, **kwargs: Any) -> str:
+    def __call__(self, **kwargs: Any) -> str:
         """Allow tools to be called directly."""
-        return self.run(*args, **kwargs)
+        return self.run(**kwargs)
 
     def __repr__(self) -> str:
         return f"{self.__class__.__name__}(name='{self.name}')"
@@ -130,6 +136,8 @@ class BaseTool(ABC):
 class Tool(BaseTool):
     """Concrete tool implementation that wraps a function."""
 
+    __slots__ = ("func", "_is_async")
+
     def __init__(
         self,
         func: Callable[..., str],
@@ -157,11 +165,13 @@ class Tool(BaseTool):
         """Execute the tool function asynchronously."""
         if self._is_async:
             return await self.func(**kwargs)
-        else:
-            # Run sync function in thread pool, support kwargs
-            loop = asyncio.get_event_loop()
-            func_partial = functools.partial(self.func, **kwargs)
-            return await loop.run_in_executor(None, func_partial)
+
+        # Run sync function in thread pool; only wrap in a partial when
+        # there are kwargs to forward
+        loop = asyncio.get_running_loop()
+        if not kwargs:
+            return await loop.run_in_executor(None, self.func)
+        return await loop.run_in_executor(None, functools.partial(self.func, **kwargs))
 
     def _create_schema(self) -> ToolSchema:
         """Create schema from function signature."""
@@ -207,16 +217,56 @@ def tool(
 class ToolRegistry:
     """Registry for managing tools with advanced features."""
 
+    __slots__ = (
+        "_tools",
+        "logger",
+        "_names_snapshot",
+        "_tools_snapshot",
+        "_openai_snapshot",
+        "_frozen",
+    )
+
     def __init__(self):
         self._tools: dict[str, BaseTool] = {}
         self.logger = Logger("tool_registry")
 
+        # Immutable views rebuilt only when the registry changes
+        self._names_snapshot: tuple[str, ...] = ()
+        self._tools_snapshot: tuple[BaseTool, ...] = ()
+        self._openai_snapshot: tuple[dict[str, Any], ...] = ()
+        self._frozen = False
+
+    def _refresh_snapshots(self) -> None:
+        """Rebuild cached views after a registration change."""
+        self._names_snapshot = tuple(self._tools)
+        self._tools_snapshot = tuple(self._tools.values())
+        self._openai_snapshot = tuple(
+            tool.schema.to_openai_format() for tool in self._tools_snapshot
+        )
+
+    @property
+    def frozen(self) -> bool:
+        """Whether the registry has been frozen against further changes."""
+        return self._frozen
+
+    def freeze(self) -> ToolRegistry:
+        """Freeze the registry so its tool set can be precomputed by consumers."""
+        self._frozen = True
+        return self
+
+    def _check_mutable(self) -> None:
+        """Raise if the registry has been frozen."""
+        if self._frozen:
+            raise ToolError("Tool registry is frozen")
+
     def register(self, tool: BaseTool) -> None:
         """Register a tool."""
+        self._check_mutable()
         if tool.name in self._tools:
-            self.logger.warning(f"Tool {tool.name} already registered, overwriting")
+            self.logger.warning("Tool %s already registered, overwriting", tool.name)
         self._tools[tool.name] = tool
-        self.logger.info(f"Registered tool: {tool.name}")
+        self._refresh_snapshots()
+        self.logger.info("Registered tool: %s", tool.name)
 
     def register_tool(
         self,
@@ -242,15 +292,15 @@ class ToolRegistry:
 
     def list_tools(self) -> list[str]:
         """List all registered tool names."""
-        return list(self._tools.keys())
+        return list(self._names_snapshot)
 
     def get_tools(self) -> list[BaseTool]:
         """Get all registered tools."""
-        return list(self._tools.values())
+        return list(self._tools_snapshot)
 
     def get_tools_for_openai(self) -> list[dict[str, Any]]:
         """Get tools in OpenAI format."""
-        return [tool.schema.to_openai_format() for tool in self._tools.values()]
+        return list(self._openai_snapshot)
 
     def execute_tool(self, name: str, **kwargs: Any) -> str:
         """Execute a tool by name."""
@@ -268,29 +318,47 @@ class ToolRegistry:
 
     def unregister(self, name: str) -> None:
         """Unregister a tool."""
+        self._check_mutable()
         if name in self._tools:
             del self._tools[name]
-            self.logger.info(f"Unregistered tool: {name}")
+            self._refresh_snapshots()
+            self.logger.info("Unregistered tool: %s", name)
+
+
+def _parse_tool_call(tool_call: ToolCall) -> tuple[str | None, dict[str, Any]]:
+    """Extract the tool name and decoded arguments from an OpenAI tool call."""
+    function = tool_call.get("function") or {}
+    arguments = function.get("arguments") or {}
+    if isinstance(arguments, str):
+        arguments = json.loads(arguments)
+    return function.get("name"), arguments
 
 
 class ToolExecutor:
     """Executor for handling tool calls with LLM integration."""
 
-    def __init__(self, registry: ToolRegistry, model: Any | None = None):
+    __slots__ = ("registry", "model", "logger", "max_concurrency")
+
+    def __init__(
+        self,
+        registry: ToolRegistry,
+        model: Any | None = None,
+        max_concurrency: int | None = 32,
+    ):
         self.registry = registry
         self.model = model
         self.logger = Logger("tool_executor")
 
+        # Caps in-flight async tool calls per batch; None means unbounded
+        self.max_concurrency = max_concurrency
+
     def execute_tool_call(self, tool_call: ToolCall) -> dict[str, Any]:
         """Execute a single tool call."""
+        name = None
         try:
-            name = tool_call.get("function", {}).get("name")
-            arguments = tool_call.get("function", {}).get("arguments", {})
-
-            if isinstance(arguments, str):
-                arguments = json.loads(arguments)
+            name, arguments = _parse_tool_call(tool_call)
 
-            self.logger.info(f"Executing tool: {name} with args: {arguments}")
+            self.logger.info("Executing tool: %s with args: %s", name, arguments)
             result = self.registry.execute_tool(name, **arguments)
 
             return {
@@ -301,7 +369,7 @@ class ToolExecutor:
             }
 
         except Exception as e:
-            self.logger.error(f"Tool execution failed: {e}")
+            self.logger.error("Tool execution failed: %s", e)
             return {
                 "tool_call_id": tool_call.get("id"),
                 "name": name,
@@ -311,14 +379,11 @@ class ToolExecutor:
 
     async def aexecute_tool_call(self, tool_call: ToolCall) -> dict[str, Any]:
         """Execute a single tool call asynchronously."""
+        name = None
         try:
-            name = tool_call.get("function", {}).get("name")
-            arguments = tool_call.get("function", {}).get("arguments", {})
+            name, arguments = _parse_tool_call(tool_call)
 
-            if isinstance(arguments, str):
-                arguments = json.loads(arguments)
-
-            self.logger.info(f"Executing async tool: {name} with args: {arguments}")
+            self.logger.info("Executing async tool: %s with args: %s", name, arguments)
             result = await self.registry.aexecute_tool(name, **arguments)
 
             return {
@@ -329,7 +394,7 @@ class ToolExecutor:
             }
 
         except Exception as e:
-            self.logger.error(f"Async tool execution failed: {e}")
+            self.logger.error("Async tool execution failed: %s", e)
             return {
                 "tool_call_id": tool_call.get("id"),
                 "name": name,
@@ -339,23 +404,55 @@ class ToolExecutor:
 
     def execute_tool_calls(self, tool_calls: list[ToolCall]) -> list[dict[str, Any]]:
         """Execute multiple tool calls."""
-        results = []
-        for tool_call in tool_calls:
-            result = self.execute_tool_call(tool_call)
-            results.append(result)
-        return results
+        execute = self.execute_tool_call
+        return [execute(tool_call) for tool_call in tool_calls]
 
     async def aexecute_tool_calls(
         self, tool_calls: list[ToolCall]
     ) -> list[dict[str, Any]]:
         """Execute multiple tool calls asynchronously."""
-        tasks = [self.aexecute_tool_call(tool_call) for tool_call in tool_calls]
-        return await asyncio.gather(*tasks)
+        if not tool_calls:
+            return []
+
+        # Created per call: a semaphore binds to the loop that first waits on
+        # it, and the executor may be reused across event loops
+        max_concurrency = self.max_concurrency
+        limit = (
+            asyncio.Semaphore(max_concurrency)
+            if max_concurrency and len(tool_calls) > max_concurrency
+            else None
+        )
+
+        if TASK_GROUP is not None:
+            # aexecute_tool_call never raises, so the group is never cancelled
+            async with TASK_GROUP() as tg:
+                tasks = [
+                    tg.create_task(self._bounded_tool_call(tool_call, limit))
+                    for tool_call in tool_calls
+                ]
+            return [task.result() for task in tasks]
+
+        return list(
+            await asyncio.gather(
+                *(self._bounded_tool_call(tool_call, limit) for tool_call in tool_calls)
+            )
+        )
+
+    async def _bounded_tool_call(
+        self, tool_call: ToolCall, limit: asyncio.Semaphore | None
+    ) -> dict[str, Any]:
+        """Execute a tool call under the batch's concurrency limit."""
+        if limit is None:
+            return await self.aexecute_tool_call(tool_call)
+        async with limit:
+            return await self.aexecute_tool_call(tool_call)
 
 
 class ToolNode(Node):
     """Node that can execute tools with LLM integration."""
 
+    __slots__ = ("tool_registry", "model", "tool_executor", "logger", "_empty_result")
+
     def __init__(
         self,
         node_id: str,
@@ -365,11 +462,26 @@ class ToolNode(Node):
     ):
         self.tool_registry = tool_registry
         self.model = model
-        self.executor = ToolExecutor(tool_registry, model)
+        self.tool_executor = ToolExecutor(tool_registry, model)
         self.logger = Logger(f"tool_node.{node_id}")
 
+        # A frozen registry cannot change, so the "no tool calls" reply is fixed
+        # and only needs copying per call
+        self._empty_result: dict[str, Any] | None = None
+        if tool_registry.frozen:
+            self._empty_result = self._describe_tools()
+
         super().__init__(node_id=node_id, executor=self._execute_tools, **kwargs)
 
+    def _describe_tools(self) -> dict[str, Any]:
+        """Build the result returned when no tool calls are provided."""
+        tools = self.tool_registry.get_tools_for_openai()
+        return {
+            "available_tools": [tool["function"]["name"] for tool in tools],
+            "tool_count": len(tools),
+            "message": "No tool calls provided",
+        }
+
     def _execute_tools(self, inputs: dict[str, Any], **context: Any) -> dict[str, Any]:
         """Execute tools based on inputs."""
         prompt = inputs.get("prompt", "")
@@ -377,16 +489,18 @@ class ToolNode(Node):
 
         if not tool_calls:
             # No tool calls, return available tools info
-            tools = self.tool_registry.get_tools_for_openai()
+            empty_result = self._empty_result
+            if empty_result is None:
+                return {"prompt": prompt, **self._describe_tools()}
+            # The tool list is copied so no two results share a mutable list
             return {
                 "prompt": prompt,
-                "available_tools": [tool["function"]["name"] for tool in tools],
-                "tool_count": len(tools),
-                "message": "No tool calls provided",
+                **empty_result,
+                "available_tools": list(empty_result["available_tools"]),
             }
 
         # Execute tool calls
-        results = self.executor.execute_tool_calls(tool_calls)
+        results = self.tool_executor.execute_tool_calls(tool_calls)
 
         return {
             "prompt": prompt,
@@ -3,7 +3,16 @@ Core modules for workflow execution.
 """
 
 from .error_handler import ErrorHandler, ErrorPolicy
-from .event_bus import Event, EventBus
+from .event_bus import (
+    EVT_NODE_ERROR,
+    EVT_NODE_EXECUTION,
+    EVT_RECOVERY,
+    EVT_STATE_BATCH_UPDATE,
+    EVT_STATE_UPDATE,
+    EVT_SUPERSTEP,
+    Event,
+    EventBus,
+)
 from .logger import Logger
 from .state_manager import StateManager
 
@@ -14,4 +23,10 @@ __all__ = [
     "EventBus",
     "Event",
     "Logger",
+    "EVT_NODE_ERROR",
+    "EVT_NODE_EXECUTION",
+    "EVT_RECOVERY",
+    "EVT_STATE_BATCH_UPDATE",
+    "EVT_STATE_UPDATE",
+    "EVT_SUPERSTEP",
 ]
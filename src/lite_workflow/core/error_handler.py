@@ -7,19 +7,30 @@ from __future__ import annotations
 import asyncio
 import logging
 import time
-from dataclasses import dataclass
 from enum import Enum
 from typing import Any, Callable
 
 from typing_extensions import TypeAlias
 
 from ..definitions.node import NodeId
-from .event_bus import Event, EventBus
+from .event_bus import EVT_NODE_ERROR, EVT_RECOVERY, Event, EventBus
 
 # Type aliases
 ErrorHandlerFunc: TypeAlias = Callable[[NodeId, Exception, dict[str, Any]], None]
 RetryPolicyFunc: TypeAlias = Callable[[int], float]  # Returns delay in seconds
 
+_logger = logging.getLogger(__name__)
+
+
+def _backoff_delay(base_delay: float, backoff_factor: float, attempt: int) -> float:
+    """Exponential backoff delay for a given attempt."""
+    return base_delay * (backoff_factor**attempt)
+
+
+def _jitter_factor(jitter_seed: int) -> float:
+    """Deterministic multiplier adding up to 10% jitter."""
+    return 1 + 0.1 * (jitter_seed % 1000 / 1000)
+
 
 class ErrorPolicy(Enum):
     """Error handling policies."""
@@ -30,10 +41,11 @@ class ErrorPolicy(Enum):
     CUSTOM = "custom"
 
 
-@dataclass
 class NodeErrorEvent(Event):
     """Event emitted when a node execution fails."""
 
+    __slots__ = ("node_id", "error", "context", "retry_count", "metadata")
+
     def __init__(
         self,
         node_id: NodeId,
@@ -42,23 +54,29 @@ class NodeErrorEvent(Event):
         retry_count: int = 0,
         metadata: dict[str, Any] | None = None,
     ):
-        super().__init__(
-            event_type="node_error",
-            data={
-                "node_id": node_id,
-                "error": str(error),
-                "error_type": type(error).__name__,
-                "context": context,
-                "retry_count": retry_count,
-                "metadata": metadata or {},
-            },
-        )
+        super().__init__(event_type=EVT_NODE_ERROR)
+        self.node_id = node_id
+        self.error = error
+        self.context = context
+        self.retry_count = retry_count
+        self.metadata = metadata
+
+    def _build_data(self) -> dict[str, Any]:
+        return {
+            "node_id": self.node_id,
+            "error": str(self.error),
+            "error_type": type(self.error).__name__,
+            "context": self.context,
+            "retry_count": self.retry_count,
+            "metadata": self.metadata or {},
+        }
 
 
-@dataclass
 class RecoveryEvent(Event):
     """Event emitted when error recovery is attempted."""
 
+    __slots__ = ("node_id", "recovery_action", "success", "metadata")
+
     def __init__(
         self,
         node_id: NodeId,
@@ -66,20 +84,40 @@ class RecoveryEvent(Event):
         success: bool,
         metadata: dict[str, Any] | None = None,
     ):
-        super().__init__(
-            event_type="recovery",
-            data={
-                "node_id": node_id,
-                "recovery_action": recovery_action,
-                "success": success,
-                "metadata": metadata or {},
-            },
-        )
+        super().__init__(event_type=EVT_RECOVERY)
+        self.node_id = node_id
+        self.recovery_action = recovery_action
+        self.success = success
+        self.metadata = metadata
+
+    def _build_data(self) -> dict[str, Any]:
+        return {
+            "node_id": self.node_id,
+            "recovery_action": self.recovery_action,
+            "success": self.success,
+            "metadata": self.metadata or {},
+        }
 
 
 class ErrorHandler:
     """Centralized error handling and recovery for workflow execution."""
 
+    __slots__ = (
+        "default_policy",
+        "max_retries",
+        "base_delay",
+        "backoff_factor",
+        "event_bus",
+        "_node_policies",
+        "_node_handlers",
+        "_custom_retry_policies",
+        "logger",
+        "_delay_table",
+        "_node_jitter",
+        "_sync_dispatch",
+        "_async_dispatch",
+    )
+
     def __init__(
         self,
         default_policy: ErrorPolicy = ErrorPolicy.RETRY,
@@ -99,7 +137,28 @@ class ErrorHandler:
         self._custom_retry_policies: dict[NodeId, RetryPolicyFunc] = {}
 
         # Set up default logger
-        self.logger = logging.getLogger(__name__)
+        self.logger = _logger
+
+        # Backoff delays for every attempt up to max_retries, and per-node
+        # jitter multipliers filled on first retry of each node
+        self._delay_table: tuple[float, ...] = tuple(
+            _backoff_delay(base_delay, backoff_factor, attempt)
+            for attempt in range(max_retries + 1)
+        )
+        self._node_jitter: dict[NodeId, float] = {}
+
+        # Policy handlers, all called as (node_id, error, context, attempt).
+        # Only policies that can wait have a separate async variant.
+        self._sync_dispatch: dict[ErrorPolicy, Callable[..., Any]] = {
+            ErrorPolicy.FAIL_FAST: self._fail,
+            ErrorPolicy.SKIP: self._skip,
+            ErrorPolicy.RETRY: self._retry_sync,
+            ErrorPolicy.CUSTOM: self._handle_custom_sync,
+        }
+        self._async_dispatch: dict[ErrorPolicy, Callable[..., Any]] = {
+            ErrorPolicy.RETRY: self._retry_async,
+            ErrorPolicy.CUSTOM: self._handle_custom_async,
+        }
 
     def set_node_policy(self, node_id: NodeId, policy: ErrorPolicy) -> None:
         """Set error handling policy for a specific node."""
@@ -118,10 +177,15 @@ class ErrorHandler:
         if node_id in self._custom_retry_policies:
             return self._custom_retry_policies[node_id](attempt)
 
-        # Exponential backoff with jitter
-        delay = self.base_delay * (self.backoff_factor**attempt)
-        jitter = 0.1 * delay * (hash(node_id) % 1000 / 1000)
-        return delay + jitter
+        if attempt < len(self._delay_table):
+            delay = self._delay_table[attempt]
+        else:
+            delay = _backoff_delay(self.base_delay, self.backoff_factor, attempt)
+
+        jitter = self._node_jitter.get(node_id)
+        if jitter is None:
+            jitter = self._node_jitter[node_id] = _jitter_factor(hash(node_id))
+        return delay * jitter
 
     async def handle_error_async(
         self,
@@ -131,34 +195,14 @@ class ErrorHandler:
         attempt: int = 0,
     ) -> dict[str, Any] | None:
         """Handle node error asynchronously."""
-        self.event_bus.emit(
-            NodeErrorEvent(
-                node_id=node_id, error=error, context=context, retry_count=attempt
-            )
-        )
-
         policy = self._node_policies.get(node_id, self.default_policy)
+        if policy is not ErrorPolicy.FAIL_FAST:
+            self._emit_node_error(node_id, error, context, attempt)
 
-        if policy == ErrorPolicy.FAIL_FAST:
-            self.logger.error(f"Node {node_id} failed: {error}")
-            raise error
-
-        elif policy == ErrorPolicy.SKIP:
-            self.logger.warning(f"Skipping node {node_id} due to error: {error}")
-            self.event_bus.emit(
-                RecoveryEvent(node_id=node_id, recovery_action="skip", success=True)
-            )
-            return {"error": str(error), "skipped": True}
-
-        elif policy == ErrorPolicy.RETRY and attempt < self.max_retries:
-            return await self._retry_async(node_id, error, context, attempt)
-
-        elif policy == ErrorPolicy.CUSTOM and node_id in self._node_handlers:
-            return await self._handle_custom_async(node_id, error, context)
-
-        # Fallback: fail
-        self.logger.error(f"Node {node_id} failed permanently: {error}")
-        raise error
+        handler = self._async_dispatch.get(policy)
+        if handler is not None:
+            return await handler(node_id, error, context, attempt)
+        return self._sync_dispatch[policy](node_id, error, context, attempt)
 
     def handle_error_sync(
         self,
@@ -168,43 +212,58 @@ class ErrorHandler:
         attempt: int = 0,
     ) -> dict[str, Any] | None:
         """Handle node error synchronously."""
-        # Similar to async version but synchronous
-        self.event_bus.emit(
-            NodeErrorEvent(
-                node_id=node_id, error=error, context=context, retry_count=attempt
-            )
-        )
-
         policy = self._node_policies.get(node_id, self.default_policy)
+        if policy is not ErrorPolicy.FAIL_FAST:
+            self._emit_node_error(node_id, error, context, attempt)
+        return self._sync_dispatch[policy](node_id, error, context, attempt)
 
-        if policy == ErrorPolicy.FAIL_FAST:
-            self.logger.error(f"Node {node_id} failed: {error}")
-            raise error
+    def _emit_node_error(
+        self, node_id: NodeId, error: Exception, context: dict[str, Any], attempt: int
+    ) -> None:
+        """Publish a NodeErrorEvent for an error that a policy will handle.
 
-        elif policy == ErrorPolicy.SKIP:
-            self.logger.warning(f"Skipping node {node_id} due to error: {error}")
+        FAIL_FAST errors skip this: they propagate straight to the caller.
+        """
+        if self.event_bus.has_handlers(EVT_NODE_ERROR):
             self.event_bus.emit(
-                RecoveryEvent(node_id=node_id, recovery_action="skip", success=True)
+                NodeErrorEvent(
+                    node_id=node_id, error=error, context=context, retry_count=attempt
+                )
             )
-            return {"error": str(error), "skipped": True}
-
-        elif policy == ErrorPolicy.RETRY and attempt < self.max_retries:
-            return self._retry_sync(node_id, error, context, attempt)
 
-        elif policy == ErrorPolicy.CUSTOM and node_id in self._node_handlers:
-            return self._handle_custom_sync(node_id, error, context)
+    def _fail(
+        self, node_id: NodeId, error: Exception, context: dict[str, Any], attempt: int
+    ) -> None:
+        """Re-raise the error immediately."""
+        self.logger.error("Node %s failed: %s", node_id, error)
+        raise error
 
-        # Fallback: fail
-        self.logger.error(f"Node {node_id} failed permanently: {error}")
+    def _fail_permanently(self, node_id: NodeId, error: Exception) -> None:
+        """Re-raise the error once a policy has nothing left to try."""
+        self.logger.error("Node %s failed permanently: %s", node_id, error)
         raise error
 
+    def _skip(
+        self, node_id: NodeId, error: Exception, context: dict[str, Any], attempt: int
+    ) -> dict[str, Any]:
+        """Swallow the error and mark the node as skipped."""
+        self.logger.warning("Skipping node %s due to error: %s", node_id, error)
+        if self.event_bus.has_handlers(EVT_RECOVERY):
+            self.event_bus.emit(
+                RecoveryEvent(node_id=node_id, recovery_action="skip", success=True)
+            )
+        return {"error": str(error), "skipped": True}
+
     async def _retry_async(
         self, node_id: NodeId, error: Exception, context: dict[str, Any], attempt: int
     ) -> dict[str, Any]:
         """Retry node execution asynchronously."""
+        if attempt >= self.max_retries:
+            self._fail_permanently(node_id, error)
+
         delay = self.get_retry_delay(node_id, attempt)
         self.logger.info(
-            f"Retrying node {node_id} in {delay:.2f}s (attempt {attempt + 1})"
+            "Retrying node %s in %.2fs (attempt %d)", node_id, delay, attempt + 1
         )
 
         await asyncio.sleep(delay)
@@ -217,9 +276,23 @@ class ErrorHandler:
         self, node_id: NodeId, error: Exception, context: dict[str, Any], attempt: int
     ) -> dict[str, Any]:
         """Retry node execution synchronously."""
+        if attempt >= self.max_retries:
+            self._fail_permanently(node_id, error)
+
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            pass
+        else:
+            # time.sleep() here would stall every task on the loop
+            raise RuntimeError(
+                "handle_error_sync() called from a running event loop; "
+                "use handle_error_async() instead"
+            )
+
         delay = self.get_retry_delay(node_id, attempt)
         self.logger.info(
-            f"Retrying node {node_id} in {delay:.2f}s (attempt {attempt + 1})"
+            "Retrying node %s in %.2fs (attempt %d)", node_id, delay, attempt + 1
         )
 
         time.sleep(delay)
@@ -231,18 +304,23 @@ class ErrorHandler:
         node_id: NodeId,
         error: Exception,
         context: dict[str, Any],
+        attempt: int,
     ) -> dict[str, Any] | None:
         """Handle custom error asynchronously."""
+        if node_id not in self._node_handlers:
+            self._fail_permanently(node_id, error)
+
         try:
             result = self._node_handlers[node_id](node_id, error, context)
-            self.event_bus.emit(
-                RecoveryEvent(
-                    node_id=node_id, recovery_action="custom_async", success=True
+            if self.event_bus.has_handlers(EVT_RECOVERY):
+                self.event_bus.emit(
+                    RecoveryEvent(
+                        node_id=node_id, recovery_action="custom_async", success=True
+                    )
                 )
-            )
             return result
         except Exception as e:
-            self.logger.error(f"Custom async handler for node {node_id} failed: {e}")
+            self.logger.error("Custom async handler for node %s failed: %s", node_id, e)
             raise RuntimeError(
                 f"Custom async handler for node {node_id} failed permanently: {e}"
             ) from e
@@ -252,18 +330,23 @@ class ErrorHandler:
         node_id: NodeId,
         error: Exception,
         context: dict[str, Any],
+        attempt: int,
     ) -> dict[str, Any] | None:
         """Handle custom error synchronously."""
+        if node_id not in self._node_handlers:
+            self._fail_permanently(node_id, error)
+
         try:
             result = self._node_handlers[node_id](node_id, error, context)
-            self.event_bus.emit(
-                RecoveryEvent(
-                    node_id=node_id, recovery_action="custom_sync", success=True
+            if self.event_bus.has_handlers(EVT_RECOVERY):
+                self.event_bus.emit(
+                    RecoveryEvent(
+                        node_id=node_id, recovery_action="custom_sync", success=True
+                    )
                 )
-            )
             return result
         except Exception as e:
-            self.logger.error(f"Custom sync handler for node {node_id} failed: {e}")
+            self.logger.error("Custom sync handler for node %s failed: %s", node_id, e)
             raise RuntimeError(
                 f"Custom sync handler for node {node_id} failed permanently: {e}"
             ) from e
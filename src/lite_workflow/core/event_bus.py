@@ -4,25 +4,71 @@ Event-driven architecture for workflow execution.
 
 from __future__ import annotations
 
-import inspect
+import asyncio
+import logging
+import sys
 import threading
-from dataclasses import dataclass
-from typing import Any, Callable
+import time
+from typing import Any, Callable, Iterable
+
+_log = logging.getLogger(__name__)
+
+# Built-in event types. Use these when subscribing or emitting so every
+# handler-map lookup shares one interned key.
+EVT_NODE_ERROR = sys.intern("node_error")
+EVT_RECOVERY = sys.intern("recovery")
+EVT_STATE_UPDATE = sys.intern("state_update")
+EVT_STATE_BATCH_UPDATE = sys.intern("state_batch_update")
+EVT_SUPERSTEP = sys.intern("superstep")
+EVT_NODE_EXECUTION = sys.intern("node_execution")
 
 
-@dataclass
 class Event:
-    """Base class for all events in the system."""
+    """Base class for all events in the system.
 
-    event_type: str
-    data: dict[str, Any]
-    timestamp: float | None = None
+    Fixed-schema subclasses keep their fields as slots, pass ``data=None`` and
+    override ``_build_data`` so the payload dict is only built when read.
+    """
 
-    def __post_init__(self):
-        if self.timestamp is None:
-            self.timestamp = (
-                threading.local()._time if hasattr(threading.local(), "_time") else 0.0
-            )
+    __slots__ = ("event_type", "_data", "_timestamp")
+
+    def __init__(
+        self,
+        event_type: str,
+        data: dict[str, Any] | None = None,
+        timestamp: float | None = None,
+    ):
+        self.event_type = event_type
+        self._data = data
+        self._timestamp = timestamp
+
+    def _build_data(self) -> dict[str, Any]:
+        """Build the payload for events constructed without ``data``."""
+        return {}
+
+    @property
+    def data(self) -> dict[str, Any]:
+        """Event payload, built on first access."""
+        if self._data is None:
+            self._data = self._build_data()
+        return self._data
+
+    @property
+    def timestamp(self) -> float:
+        """Monotonic timestamp, taken on first access unless given explicitly."""
+        if self._timestamp is None:
+            self._timestamp = time.monotonic()
+        return self._timestamp
+
+    def stamp(self) -> None:
+        """Take the timestamp now, e.g. before queueing for later delivery."""
+        if self._timestamp is None:
+            self._timestamp = time.monotonic()
+
+    def __repr__(self) -> str:
+        return (
+            f"{type(self).__name__}(event_type={self.event_type!r}, data={self.data!r})"
+        )
 
 
 class EventHandler:
@@ -33,75 +79,236 @@ class EventHandler:
         pass
 
 
+def _log_handler_error(event: Event, is_global: bool) -> None:
+    """Log the exception currently being handled for a failed handler."""
+    if is_global:
+        _log.exception("Error in global handler")
+    else:
+        _log.exception("Error in handler for %s", event.event_type)
+
+
+def _register(handler: Callable, is_global: bool) -> tuple[Callable, Callable, bool]:
+    """Wrap ``handler`` so a failure is logged instead of reaching the emitter."""
+    if asyncio.iscoroutinefunction(handler):
+
+        async def safe_async(event: Event) -> None:
+            try:
+                await handler(event)
+            except Exception:
+                _log_handler_error(event, is_global)
+
+        return handler, safe_async, True
+
+    def safe_sync(event: Event) -> None:
+        try:
+            handler(event)
+        except Exception:
+            _log_handler_error(event, is_global)
+
+    return handler, safe_sync, False
+
+
 class EventBus:
-    """A simple, thread-safe event bus for publishing and subscribing to events."""
+    """A simple, thread-safe event bus for publishing and subscribing to events.
+
+    Handler exceptions are logged and never propagate to the emitter. The sync
+    ``emit``/``emit_many`` schedule coroutine handlers as tasks on the running
+    event loop; without one in the emitting thread they are skipped with a
+    warning. Use ``emit_async`` to await them.
+    """
 
     def __init__(self):
-        self._handlers: dict[str, list[Callable]] = {}
-        self._global_handlers: list[Callable] = []
+        # Registrations are built once in on()/on_global(), so the emit loops
+        # need neither per-event coroutine checks nor try/except. Each list of
+        # registrations is an immutable tuple that writers replace under
+        # _write_lock, so emit iterates it without locking or copying.
+        self._handlers: dict[str, tuple[tuple[Callable, Callable, bool], ...]] = {}
+        self._global_handlers: tuple[tuple[Callable, Callable, bool], ...] = ()
+        self._write_lock = threading.Lock()
+        # Lets emit() bail out with a single check when nobody is listening
+        self._any_handlers = False
+        # Strong references to coroutine handlers scheduled by sync emits
+        self._scheduled: set[asyncio.Task] = set()
+
+    def _schedule(self, safe_async: Callable, event: Event) -> None:
+        """Run a coroutine handler from a sync emit on the running loop."""
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            _log.warning(
+                "No running event loop; skipped async handler for %s",
+                event.event_type,
+            )
+            return
+        task = loop.create_task(safe_async(event))
+        self._scheduled.add(task)
+        task.add_done_callback(self._scheduled.discard)
+
+    def _refresh_any_handlers(self) -> None:
+        """Recompute whether any handler is registered."""
+        self._any_handlers = bool(self._global_handlers) or any(self._handlers.values())
+
+    @staticmethod
+    def _without_handler(
+        entries: tuple[tuple[Callable, Callable, bool], ...], handler: Callable
+    ) -> tuple[tuple[Callable, Callable, bool], ...]:
+        """Return ``entries`` minus the first registration of ``handler``."""
+        for i, (registered, _, _) in enumerate(entries):
+            if registered == handler:
+                return entries[:i] + entries[i + 1 :]
+        return entries
+
+    def has_handlers(self, event_type: str) -> bool:
+        """Check whether an event of this type would reach any handler.
+
+        Emitters use this to skip building events nobody will receive.
+        """
+        return self._any_handlers and (
+            bool(self._global_handlers) or bool(self._handlers.get(event_type))
+        )
 
     def on(self, event_type: str, handler: Callable) -> None:
         """Register a handler for a specific event type."""
-        if event_type not in self._handlers:
-            self._handlers[event_type] = []
-        self._handlers[event_type].append(handler)
+        registration = _register(handler, is_global=False)
+        with self._write_lock:
+            self._handlers[event_type] = self._handlers.get(event_type, ()) + (
+                registration,
+            )
+            self._any_handlers = True
 
     def on_global(self, handler: Callable) -> None:
         """Register a handler for all events."""
-        self._global_handlers.append(handler)
+        registration = _register(handler, is_global=True)
+        with self._write_lock:
+            self._global_handlers += (registration,)
+            self._any_handlers = True
 
     def off(self, event_type: str, handler: Callable) -> None:
         """Unregister a handler for a specific event type."""
-        if event_type in self._handlers:
-            try:
-                self._handlers[event_type].remove(handler)
-            except ValueError:
-                pass
+        with self._write_lock:
+            if event_type in self._handlers:
+                self._handlers[event_type] = self._without_handler(
+                    self._handlers[event_type], handler
+                )
+                self._refresh_any_handlers()
 
     def off_any(self, handler: Callable) -> None:
         """Unregister a global handler."""
-        try:
-            self._global_handlers.remove(handler)
-        except ValueError:
-            pass
+        with self._write_lock:
+            self._global_handlers = self._without_handler(
+                self._global_handlers, handler
+            )
+            self._refresh_any_handlers()
 
     def emit(self, event: Event) -> None:
         """Emit an event to all registered handlers."""
+        if not self._any_handlers:
+            return
+
         # Handle type-specific handlers
-        for handler in self._handlers.get(event.event_type, []):
-            handler(event)
+        for _, safe, is_coro in self._handlers.get(event.event_type, ()):
+            if is_coro:
+                self._schedule(safe, event)
+            else:
+                safe(event)
 
         # Handle global handlers
-        for handler in self._global_handlers:
-            handler(event)
+        for _, safe, is_coro in self._global_handlers:
+            if is_coro:
+                self._schedule(safe, event)
+            else:
+                safe(event)
+
+    def emit_many(self, events: Iterable[Event]) -> None:
+        """Emit a batch of events in order, resolving handlers once per type."""
+        if not self._any_handlers:
+            return
+
+        handlers = self._handlers
+        global_handlers = self._global_handlers
+        resolved: dict[str, tuple] = {}
+        for event in events:
+            event_type = event.event_type
+            typed = resolved.get(event_type)
+            if typed is None:
+                typed = resolved[event_type] = handlers.get(event_type, ())
+            for _, safe, is_coro in typed:
+                if is_coro:
+                    self._schedule(safe, event)
+                else:
+                    safe(event)
+            for _, safe, is_coro in global_handlers:
+                if is_coro:
+                    self._schedule(safe, event)
+                else:
+                    safe(event)
+
+    async def emit_many_async(self, events: Iterable[Event]) -> None:
+        """Emit a batch of events in order, awaiting coroutine handlers.
+
+        Sync handlers run inline in event order; coroutine handlers of the
+        whole batch are awaited concurrently once all sync handlers have run.
+        """
+        if not self._any_handlers:
+            return
+
+        handlers = self._handlers
+        global_handlers = self._global_handlers
+        resolved: dict[str, tuple] = {}
+        coros = []
+        for event in events:
+            event_type = event.event_type
+            typed = resolved.get(event_type)
+            if typed is None:
+                typed = resolved[event_type] = handlers.get(event_type, ())
+            for _, safe, is_coro in typed:
+                if is_coro:
+                    coros.append(safe(event))
+                else:
+                    safe(event)
+            for _, safe, is_coro in global_handlers:
+                if is_coro:
+                    coros.append(safe(event))
+                else:
+                    safe(event)
+
+        if coros:
+            await asyncio.gather(*coros)
 
     async def emit_async(self, event: Event) -> None:
-        """Emit an event asynchronously."""
+        """Emit an event asynchronously.
+
+        Sync handlers run inline in registration order; coroutine handlers
+        are awaited concurrently once all sync handlers have run.
+        """
+        if not self._any_handlers:
+            return
+
+        coros = []
+
         # Handle global handlers
-        for handler in self._global_handlers:
-            try:
-                if inspect.iscoroutinefunction(handler):
-                    await handler(event)
-                else:
-                    handler(event)
-            except Exception as e:
-                print(f"Error in global handler: {e}")
+        for _, safe, is_coro in self._global_handlers:
+            if is_coro:
+                coros.append(safe(event))
+            else:
+                safe(event)
 
         # Handle specific type handlers
-        if event.event_type in self._handlers:
-            for handler in self._handlers[event.event_type]:
-                try:
-                    if inspect.iscoroutinefunction(handler):
-                        await handler(event)
-                    else:
-                        handler(event)
-                except Exception as e:
-                    print(f"Error in handler for {event.event_type}: {e}")
+        for _, safe, is_coro in self._handlers.get(event.event_type, ()):
+            if is_coro:
+                coros.append(safe(event))
+            else:
+                safe(event)
+
+        if coros:
+            await asyncio.gather(*coros)
 
     def clear(self) -> None:
         """Clear all handlers."""
-        self._handlers.clear()
-        self._global_handlers.clear()
+        with self._write_lock:
+            self._handlers = {}
+            self._global_handlers = ()
+            self._any_handlers = False
 
     def get_handler_count(self, event_type: str = None) -> int:
         """Get number of handlers for an event type."""
@@ -109,4 +316,4 @@ class EventBus:
             return len(self._global_handlers) + sum(
                 len(handlers) for handlers in self._handlers.values()
             )
-        return len(self._handlers.get(event_type, [])) + len(self._global_handlers)
+        return len(self._handlers.get(event_type, ())) + len(self._global_handlers)
@@ -6,11 +6,27 @@ from __future__ import annotations
 
 import logging
 import sys
-from typing import Any
+from typing import Any, Mapping
+
+_DEFAULT_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+_DEFAULT_HANDLER: logging.Handler | None = None
+
+
+def _default_handler() -> logging.Handler:
+    """Return the stdout handler shared by every default-formatted Logger."""
+    global _DEFAULT_HANDLER
+    if _DEFAULT_HANDLER is None:
+        _DEFAULT_HANDLER = logging.StreamHandler(sys.stdout)
+        _DEFAULT_HANDLER.setFormatter(logging.Formatter(_DEFAULT_FORMAT))
+    return _DEFAULT_HANDLER
 
 
 class Logger:
-    """Structured logger for workflow execution."""
+    """Structured logger for workflow execution.
+
+    Level checks for the per-node helpers are cached; change the level through
+    ``set_level`` so the cache stays in sync.
+    """
 
     def __init__(
         self,
@@ -22,13 +38,26 @@ class Logger:
         self.logger.setLevel(level)
 
         if not self.logger.handlers:
-            handler = logging.StreamHandler(sys.stdout)
-            formatter = logging.Formatter(
-                format_string or "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
-            )
-            handler.setFormatter(formatter)
+            if format_string is None:
+                handler = _default_handler()
+            else:
+                handler = logging.StreamHandler(sys.stdout)
+                handler.setFormatter(logging.Formatter(format_string))
             self.logger.addHandler(handler)
 
+        self._refresh_level_cache()
+
+    def _refresh_level_cache(self) -> None:
+        """Cache the level checks used on the per-node hot path."""
+        self._is_debug = self.logger.isEnabledFor(logging.DEBUG)
+        self._is_info = self.logger.isEnabledFor(logging.INFO)
+        self._is_error = self.logger.isEnabledFor(logging.ERROR)
+
+    @property
+    def debug_enabled(self) -> bool:
+        """Whether DEBUG records are emitted (cached, see ``set_level``)."""
+        return self._is_debug
+
     def log_workflow_start(
         self, workflow_id: str, metadata: dict[str, Any] | None = None
     ) -> None:
@@ -46,8 +75,11 @@ class Logger:
         duration: float,
     ) -> None:
         """Log node execution completion."""
+        if not self._is_info:
+            return
         self.logger.info(
-            f"Node {node_id} executed successfully",
+            "Node %s executed successfully",
+            node_id,
             extra={
                 "node_id": node_id,
                 "inputs": inputs,
@@ -60,14 +92,18 @@ class Logger:
         self, node_id: str, error: Exception, context: dict[str, Any]
     ) -> None:
         """Log node execution error."""
+        if not self._is_error:
+            return
         self.logger.error(
-            f"Node {node_id} failed: {str(error)}",
+            "Node %s failed: %s",
+            node_id,
+            error,
             extra={"node_id": node_id, "error": str(error), "context": context},
             exc_info=True,
         )
 
     def log_workflow_complete(
-        self, workflow_id: str, duration: float, final_state: dict[str, Any]
+        self, workflow_id: str, duration: float, final_state: Mapping[str, Any]
     ) -> None:
         """Log workflow completion."""
         self.logger.info(
@@ -79,22 +115,23 @@ class Logger:
             },
         )
 
-    def debug(self, message: str, **kwargs: Any) -> None:
+    def debug(self, message: str, *args: Any, **kwargs: Any) -> None:
         """Debug logging."""
-        self.logger.debug(message, extra=kwargs)
+        self.logger.debug(message, *args, extra=kwargs)
 
-    def info(self, message: str, **kwargs: Any) -> None:
+    def info(self, message: str, *args: Any, **kwargs: Any) -> None:
         """Info logging."""
-        self.logger.info(message, extra=kwargs)
+        self.logger.info(message, *args, extra=kwargs)
 
-    def warning(self, message: str, **kwargs: Any) -> None:
+    def warning(self, message: str, *args: Any, **kwargs: Any) -> None:
         """Warning logging."""
-        self.logger.warning(message, extra=kwargs)
+        self.logger.warning(message, *args, extra=kwargs)
 
-    def error(self, message: str, **kwargs: Any) -> None:
+    def error(self, message: str, *args: Any, **kwargs: Any) -> None:
         """Error logging."""
-        self.logger.error(message, extra=kwargs)
+        self.logger.error(message, *args, extra=kwargs)
 
     def set_level(self, level: int) -> None:
         """Set logging level."""
         self.logger.setLevel(level)
+        self._refresh_level_cache()
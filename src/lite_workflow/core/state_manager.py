@@ -5,12 +5,13 @@ Advanced state management with conflict resolution and event handling.
 from __future__ import annotations
 
 import threading
-from typing import Any, Callable
+from types import MappingProxyType
+from typing import Any, Callable, Iterable, Mapping
 
 from typing_extensions import TypeAlias
 
-from ..definitions.state import InMemoryState, State, UpdateStrategy
-from .event_bus import Event, EventBus
+from ..definitions.state import InMemoryState, SlottedState, State, UpdateStrategy
+from .event_bus import EVT_STATE_BATCH_UPDATE, EVT_STATE_UPDATE, Event, EventBus
 
 StateKey: TypeAlias = str
 StateValue: TypeAlias = Any
@@ -20,6 +21,8 @@ MergeStrategy: TypeAlias = Callable[[StateValue, StateValue], StateValue]
 class StateUpdateEvent(Event):
     """Event emitted when state is updated."""
 
+    __slots__ = ("key", "old_value", "new_value", "source", "metadata")
+
     def __init__(
         self,
         key: StateKey,
@@ -28,126 +31,262 @@ class StateUpdateEvent(Event):
         source: str,
         metadata: dict[str, Any] | None = None,
     ):
-        super().__init__(
-            event_type="state_update",
-            data={
-                "key": key,
-                "old_value": old_value,
-                "new_value": new_value,
-                "source": source,
-                "metadata": metadata or {},
-            },
-        )
+        super().__init__(event_type=EVT_STATE_UPDATE)
+        self.key = key
+        self.old_value = old_value
+        self.new_value = new_value
+        self.source = source
+        self.metadata = metadata
+
+    def _build_data(self) -> dict[str, Any]:
+        return {
+            "key": self.key,
+            "old_value": self.old_value,
+            "new_value": self.new_value,
+            "source": self.source,
+            "metadata": self.metadata or {},
+        }
+
+
+class BatchStateUpdateEvent(Event):
+    """Event emitted once for a multi-key state change."""
+
+    __slots__ = ("changes", "source", "metadata")
+
+    def __init__(
+        self,
+        changes: list[tuple[StateKey, StateValue, StateValue]],
+        source: str,
+        metadata: dict[str, Any] | None = None,
+    ):
+        super().__init__(event_type=EVT_STATE_BATCH_UPDATE)
+        self.changes = changes
+        self.source = source
+        self.metadata = metadata
+
+    def _build_data(self) -> dict[str, Any]:
+        return {
+            "changes": self.changes,
+            "source": self.source,
+            "metadata": self.metadata or {},
+        }
 
 
 class StateManager:
-    """Thread-safe state management with conflict resolution."""
+    """Thread-safe state management with conflict resolution.
+
+    State lives in a copy-on-write dict: writers build a new dict under the
+    lock and swap the reference in, so readers never take the lock and always
+    observe a complete snapshot.
+
+    Pass ``schema`` when the key set is known up front: ``get_state`` then
+    returns a ``SlottedState`` for it instead of a dict-backed state. That
+    instance is built once per published state and shared by every reader
+    until the next write, so treat it as read-only.
+    """
 
     def __init__(
         self,
         initial_state: dict[StateKey, StateValue] | None = None,
         event_bus: EventBus | None = None,
+        schema: Iterable[StateKey] | None = None,
     ):
-        self._state = InMemoryState(initial_state)
+        self._snapshot: dict[StateKey, StateValue] = dict(initial_state or {})
+        self._version = 0
         self._event_bus = event_bus or EventBus()
-        self._lock = threading.RLock()
+        # Plain Lock: nothing re-enters it, and events are emitted after release
+        # so handlers may write back to the manager
+        self._lock = threading.Lock()
         self._merge_strategies: dict[StateKey, MergeStrategy] = {}
+        self._state_cls = None if schema is None else SlottedState.for_keys(schema)
+        # (snapshot, state) for the last SlottedState built by get_state
+        self._slotted: tuple[dict[StateKey, StateValue], State] | None = None
+
+    def _publish(self, new_state: dict[StateKey, StateValue]) -> None:
+        """Swap in a new state dict. Caller must hold the lock."""
+        self._snapshot = new_state
+        self._version += 1
+
+    @property
+    def version(self) -> int:
+        """Counter incremented on every state change."""
+        return self._version
 
     def get_state(self) -> State:
-        """Get current state (read-only view)."""
-        with self._lock:
-            return InMemoryState(self._state.to_dict())
+        """Get current state (read-only view).
+
+        Falls back to ``InMemoryState`` once the state holds keys outside the
+        declared schema.
+        """
+        state_cls = self._state_cls
+        snapshot = self._snapshot
+        if state_cls is not None:
+            # Keyed on the snapshot itself: writers always publish a new dict
+            cached = self._slotted
+            if cached is not None and cached[0] is snapshot:
+                return cached[1]
+            if state_cls._keyset.issuperset(snapshot):
+                state = state_cls(snapshot)
+                self._slotted = (snapshot, state)
+                return state
+        # Shared, so writes to the returned state never reach the manager
+        return InMemoryState.shared(snapshot)
 
     def get(self, key: StateKey, default: StateValue = None) -> StateValue:
-        """Get state value by key."""
-        with self._lock:
-            return self._state.get(key, default)
+        """Get state value by key.
+
+        Lock-free: a read racing a concurrent ``set`` may return the value from
+        just before that write, exactly as if it had run first. The update
+        event is only emitted after the new state is published.
+        """
+        return self._snapshot.get(key, default)
 
     def set(self, key: StateKey, value: StateValue, source: str = "unknown") -> None:
+        """Set a single state value."""
         with self._lock:
-            old_value = self._state.get(key)
-            self._state.set(key, value)
+            old_value = self._set_locked(key, value)
 
+        if self._event_bus.has_handlers(EVT_STATE_UPDATE):
             self._event_bus.emit(
                 StateUpdateEvent(
                     key=key, old_value=old_value, new_value=value, source=source
                 )
             )
 
+    def _set_locked(self, key: StateKey, value: StateValue) -> StateValue:
+        """Publish ``key = value`` and return the old value. Caller holds the lock."""
+        new_state = dict(self._snapshot)
+        old_value = new_state.get(key)
+        new_state[key] = value
+        self._publish(new_state)
+        return old_value
+
     def update(
         self,
         updates: dict[StateKey, StateValue],
         strategy: UpdateStrategy = UpdateStrategy.OVERWRITE,
         source: str = "unknown",
     ) -> None:
-        """Update multiple state values with conflict resolution."""
+        """Update multiple state values with conflict resolution.
+
+        Changes are applied atomically: if any key is rejected, none are kept.
+        A single ``BatchStateUpdateEvent`` describing every change is emitted.
+        """
         with self._lock:
-            for key, new_value in updates.items():
-                if strategy == UpdateStrategy.OVERWRITE:
-                    self.set(key, new_value, source)
-                elif strategy == UpdateStrategy.MERGE:
-                    self._merge_value(key, new_value, source)
-                elif strategy == UpdateStrategy.IGNORE:
-                    if key not in self._state:
-                        self.set(key, new_value, source)
-                elif strategy == UpdateStrategy.RAISE:
-                    if key in self._state:
-                        raise KeyError(f"Key '{key}' already exists")
-                    self.set(key, new_value, source)
-
-    def _merge_value(self, key: StateKey, new_value: StateValue, source: str) -> None:
-        """Merge values using registered strategy or intelligent defaults."""
-        old_value = self._state.get(key)
+            new_state = dict(self._snapshot)
+            changes = self._apply_locked(new_state, updates, strategy)
+            self._publish(new_state)
 
-        if key in self._merge_strategies:
-            merged = self._merge_strategies[key](old_value, new_value)
-        elif isinstance(old_value, dict) and isinstance(new_value, dict):
-            merged = {**old_value, **new_value}
-        elif isinstance(old_value, list) and isinstance(new_value, list):
-            merged = old_value + new_value
-        else:
-            merged = new_value
+        if changes and self._event_bus.has_handlers(EVT_STATE_BATCH_UPDATE):
+            self._event_bus.emit(BatchStateUpdateEvent(changes=changes, source=source))
 
-        self.set(key, merged, source)
+    def update_many(
+        self,
+        batch: Iterable[tuple[dict[StateKey, StateValue], str]],
+        strategy: UpdateStrategy = UpdateStrategy.OVERWRITE,
+    ) -> None:
+        """Apply several ``(updates, source)`` pairs with a single state copy.
+
+        Equivalent to calling ``update`` for each pair in order, except that
+        the result is published once, atomically. One ``BatchStateUpdateEvent``
+        is emitted per source that changed anything.
+        """
+        batch = list(batch)
+        if not batch:
+            return
+
+        with self._lock:
+            new_state = dict(self._snapshot)
+            per_source = [
+                (source, self._apply_locked(new_state, updates, strategy))
+                for updates, source in batch
+            ]
+            self._publish(new_state)
+
+        if self._event_bus.has_handlers(EVT_STATE_BATCH_UPDATE):
+            for source, changes in per_source:
+                if changes:
+                    self._event_bus.emit(
+                        BatchStateUpdateEvent(changes=changes, source=source)
+                    )
+
+    def _apply_locked(
+        self,
+        new_state: dict[StateKey, StateValue],
+        updates: dict[StateKey, StateValue],
+        strategy: UpdateStrategy,
+    ) -> list[tuple[StateKey, StateValue, StateValue]]:
+        """Apply ``updates`` to ``new_state`` in place and return the changes.
+
+        Caller holds the lock and publishes ``new_state`` afterwards.
+        """
+        changes: list[tuple[StateKey, StateValue, StateValue]] = []
+        for key, new_value in updates.items():
+            if strategy == UpdateStrategy.MERGE:
+                new_value = self._merge_value(key, new_state.get(key), new_value)
+            elif strategy == UpdateStrategy.IGNORE:
+                if key in new_state:
+                    continue
+            elif strategy == UpdateStrategy.RAISE:
+                if key in new_state:
+                    raise KeyError(f"Key '{key}' already exists")
+
+            changes.append((key, new_state.get(key), new_value))
+            new_state[key] = new_value
+        return changes
+
+    def _merge_value(
+        self, key: StateKey, old_value: StateValue, new_value: StateValue
+    ) -> StateValue:
+        """Merge values using registered strategy or intelligent defaults."""
+        if key in self._merge_strategies:
+            return self._merge_strategies[key](old_value, new_value)
+        if isinstance(old_value, dict) and isinstance(new_value, dict):
+            return {**old_value, **new_value}
+        if isinstance(old_value, list) and isinstance(new_value, list):
+            return old_value + new_value
+        return new_value
 
     def register_merge_strategy(self, key: StateKey, strategy: MergeStrategy) -> None:
-        """Register custom merge strategy for a key."""
+        """Register custom merge strategy for a key.
+
+        Strategies run while the state lock is held and must not call back
+        into this manager.
+        """
         with self._lock:
             self._merge_strategies[key] = strategy
 
-    def snapshot(self) -> dict[StateKey, StateValue]:
-        """Create a snapshot of current state."""
-        with self._lock:
-            return self._state.to_dict()
+    def snapshot(self) -> Mapping[StateKey, StateValue]:
+        """Return a read-only view of the current state.
 
-    def restore(self, snapshot: dict[StateKey, StateValue]) -> None:
+        The view is O(1) to create and never changes, since writers replace
+        the underlying dict rather than mutating it. Use ``dict(...)`` for a
+        mutable copy.
+        """
+        return MappingProxyType(self._snapshot)
+
+    def restore(self, snapshot: Mapping[StateKey, StateValue]) -> None:
         """Restore state from snapshot."""
         with self._lock:
-            self._state.clear()
-            self._state.update(snapshot)
+            self._publish(dict(snapshot))
 
     def keys(self) -> list[StateKey]:
         """Get all state keys."""
-        with self._lock:
-            return list(self._state.to_dict().keys())
+        return list(self._snapshot)
 
     def clear(self, source: str = "unknown") -> None:
         """Clear all state."""
         with self._lock:
-            keys = list(self._state.to_dict().keys())
-            self._state.clear()
+            old_state = self._snapshot
+            self._publish({})
 
-            for key in keys:
-                self._event_bus.emit(
-                    StateUpdateEvent(
-                        key=key, old_value=None, new_value=None, source=source
-                    )
-                )
+        if old_state and self._event_bus.has_handlers(EVT_STATE_BATCH_UPDATE):
+            changes = [(key, value, None) for key, value in old_state.items()]
+            self._event_bus.emit(BatchStateUpdateEvent(changes=changes, source=source))
 
     def __len__(self) -> int:
-        """Return number of keys in state."""
-        with self._lock:
-            return len(self._state)
+        """Return number of keys in state (lock-free, see ``get``)."""
+        return len(self._snapshot)
 
     def __repr__(self) -> str:
         return f"StateManager(keys={len(self)})"
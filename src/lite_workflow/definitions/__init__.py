@@ -10,7 +10,7 @@ This module defines the fundamental building blocks:
 
 from .edge import Edge, EdgeCondition
 from .graph import Graph, GraphConfig
-from .message import ChatResult, Message
+from .message import ChatResult, Message, messages_to_payload
 from .node import Node, NodeConfig
 from .state import State, UpdateStrategy
 
@@ -27,4 +27,5 @@ __all__ = [
     # Messages
     "Message",
     "ChatResult",
+    "messages_to_payload",
 ]
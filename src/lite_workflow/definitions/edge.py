@@ -13,6 +13,7 @@ from typing import (
 
 from typing_extensions import TypeAlias
 
+from .._compat import DATACLASS_SLOTS
 from ..definitions.state import State
 
 # Type aliases
@@ -22,6 +23,8 @@ ConditionResult: TypeAlias = bool
 class EdgeCondition(ABC):
     """Protocol for edge conditions."""
 
+    __slots__ = ()
+
     @abstractmethod
     def __call__(
         self, outputs: dict[str, Any], state: State
@@ -30,7 +33,12 @@ class EdgeCondition(ABC):
         ...
 
 
-@dataclass
+def _always_traverse(outputs: dict[str, Any], state: State) -> bool:
+    """Traversal check for unconditional edges."""
+    return True
+
+
+@dataclass(**DATACLASS_SLOTS)
 class Edge:
     """A directed edge connecting two nodes in a graph."""
 
@@ -39,10 +47,6 @@ class Edge:
     condition: EdgeCondition | None = None  # UP045
     metadata: dict[str, Any] = field(default_factory=dict)  # UP006
 
-    def __post_init__(self) -> None:
-        if self.metadata is None:
-            self.metadata = {}
-
     def should_traverse(self, outputs: dict[str, Any], state: State) -> bool:  # UP006
         """Determine if this edge should be traversed."""
         if self.condition is None:
@@ -53,7 +57,7 @@ class Edge:
         return f"Edge(source='{self.source_id}', target='{self.target_id}')"
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class ConditionalEdge(Edge):
     """An edge that is traversed only if a condition is met."""
 
@@ -64,15 +68,17 @@ class ConditionalEdge(Edge):
         condition: EdgeCondition,
         metadata: dict[str, Any] | None = None,  # UP045, UP006
     ):
-        super().__init__(
+        # Explicit base call: zero-argument super() breaks on slotted dataclasses
+        Edge.__init__(
+            self,
             source_id=source_id,
             target_id=target_id,
             condition=condition,
-            metadata=metadata,
+            metadata={} if metadata is None else metadata,
         )
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class WhenCondition(EdgeCondition):
     """An edge condition that checks if a key in the outputs matches an expected value."""
 
@@ -85,7 +91,7 @@ class WhenCondition(EdgeCondition):
         return actual_value == self.expected_value
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class FunctionCondition(EdgeCondition):
     """An edge condition based on a custom function."""
 
@@ -95,6 +101,26 @@ class FunctionCondition(EdgeCondition):
         return self.func(outputs, state)
 
 
+def specialize_condition(
+    condition: EdgeCondition | None,
+) -> Callable[[dict[str, Any], State], bool]:
+    """Return the cheapest callable equivalent to ``Edge.should_traverse``.
+
+    Graphs bind this once per edge so routing costs a single call.
+    """
+    if condition is None:
+        return _always_traverse
+    if type(condition) is WhenCondition:
+        key = condition.key
+        expected_value = condition.expected_value
+
+        def traverse_when(outputs: dict[str, Any], state: State) -> bool:
+            return outputs.get(key) == expected_value
+
+        return traverse_when
+    return condition
+
+
 def when(key: str, expected_value: Any) -> WhenCondition:
     """Helper function to create a WhenCondition."""
     return WhenCondition(key=key, expected_value=expected_value)
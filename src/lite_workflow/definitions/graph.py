@@ -7,18 +7,72 @@ from __future__ import annotations
 from dataclasses import dataclass, field
 from typing import (  # Keep original types for compatibility with py38 target, ruff might be overly aggressive
     Any,
+    Callable,
 )
 
 from typing_extensions import TypeAlias
 
-from .edge import Edge
-from .node import Node, NodeId
+from .._compat import DATACLASS_SLOTS
+from .edge import Edge, WhenCondition, specialize_condition
+from .node import Node, NodeId, intern_node_id
+from .state import State
 
 # Type aliases
 GraphId: TypeAlias = str
-
-
-@dataclass
+Router: TypeAlias = Callable[[Any, State], "list[NodeId]"]
+Predicate: TypeAlias = Callable[[Any, State], bool]
+BranchTable: TypeAlias = "tuple[str, dict[Any, tuple[NodeId, ...]]]"
+
+_EMPTY: tuple[NodeId, ...] = ()
+
+
+def _kahn_csr(row_ptr: list[int], col_idx: list[int], indegree: list[int]) -> list[int]:
+    """Kahn's algorithm on a CSR graph; returns node indices in order.
+
+    A result shorter than the node count means the graph has a cycle.
+    ``indegree`` is not modified.
+    """
+    remaining = list(indegree)
+    # The output list doubles as the FIFO queue
+    order = [u for u, degree in enumerate(remaining) if degree == 0]
+    for u in order:
+        for v in col_idx[row_ptr[u] : row_ptr[u + 1]]:
+            degree = remaining[v] - 1
+            remaining[v] = degree
+            if degree == 0:
+                order.append(v)
+    return order
+
+
+def _branch_table(edges: list[Edge]) -> BranchTable | None:
+    """Build ``(key, {value: targets})`` for edges that all test one output key.
+
+    Applies when there are several conditional edges and each is an exact
+    ``when(key, value)`` on the same key with a hashable value; returns None
+    otherwise. Targets for each value keep edge order.
+    """
+    if len(edges) < 2:
+        return None
+    conditions: list[WhenCondition] = []
+    for edge in edges:
+        condition = edge.condition
+        if type(condition) is not WhenCondition:
+            return None
+        conditions.append(condition)
+    key = conditions[0].key
+    if any(c.key != key for c in conditions):
+        return None
+
+    table: dict[Any, list[NodeId]] = {}
+    try:
+        for edge, cond in zip(edges, conditions):
+            table.setdefault(cond.expected_value, []).append(edge.target_id)
+    except TypeError:  # unhashable expected value
+        return None
+    return key, {value: tuple(targets) for value, targets in table.items()}
+
+
+@dataclass(**DATACLASS_SLOTS)
 class GraphConfig:
     """Configuration for graph execution."""
 
@@ -31,6 +85,31 @@ class GraphConfig:
 class Graph:
     """A directed graph representing a workflow."""
 
+    __slots__ = (
+        "graph_id",
+        "nodes",
+        "edges",
+        "start_node",
+        "end_nodes",
+        "config",
+        "_out_edges",
+        "_in_edges",
+        "_successors",
+        "_predecessors",
+        "_routes",
+        "_branch_tables",
+        "_idx",
+        "_node_ids",
+        "_row_ptr",
+        "_col_idx",
+        "_indegree",
+        "_topo_order",
+        "_acyclic",
+        "_insertion_ordered",
+        "_reach",
+        "_routers",
+    )
+
     def __init__(
         self,
         graph_id: GraphId,
@@ -40,16 +119,31 @@ class Graph:
         end_nodes: set[NodeId] | None = None,  # UP045, UP006
         config: GraphConfig | None = None,  # UP045
     ):
+        # Edges and endpoints share the interned node ID strings, so every
+        # adjacency lookup below hashes once and compares by identity
+        for edge in edges:
+            edge.source_id = intern_node_id(edge.source_id)
+            edge.target_id = intern_node_id(edge.target_id)
+
         self.graph_id = graph_id
         self.nodes = {node.node_id: node for node in nodes}
+        # Contiguous ID snapshot for traversal; position doubles as node index
+        self._node_ids: tuple[NodeId, ...] = tuple(self.nodes)
         self.edges = edges
-        self.start_node = start_node
-        self.end_nodes = end_nodes or set()
+        self.start_node = intern_node_id(start_node)
+        self.end_nodes = {intern_node_id(node_id) for node_id in end_nodes or ()}
         self.config = config or GraphConfig()
 
         self._validate()
         self._build_adjacency_lists()
 
+        # Lazily computed; the graph is not mutated after construction
+        self._topo_order: list[NodeId] | None = None
+        self._acyclic: bool | None = None
+        self._insertion_ordered: bool | None = None
+        self._reach: list[int] | None = None
+        self._routers: dict[NodeId, Router] | None = None
+
     def _validate(self) -> None:
         """Validate graph structure."""
         if not self.graph_id:
@@ -58,24 +152,106 @@ class Graph:
         if self.start_node not in self.nodes:
             raise ValueError(f"Start node '{self.start_node}' not found")
 
-        for edge in self.edges:
-            if edge.source_id not in self.nodes:
-                raise ValueError(f"Source node '{edge.source_id}' not found")
-            if edge.target_id not in self.nodes:
-                raise ValueError(f"Target node '{edge.target_id}' not found")
+        node_ids = self.nodes.keys()
+        sources = [edge.source_id for edge in self.edges]
+        targets = [edge.target_id for edge in self.edges]
+
+        # Set difference runs in C; only the error path walks edges again
+        missing = set(sources) - node_ids
+        if missing:
+            first = next(node_id for node_id in sources if node_id in missing)
+            raise ValueError(f"Source node '{first}' not found")
+        missing = set(targets) - node_ids
+        if missing:
+            first = next(node_id for node_id in targets if node_id in missing)
+            raise ValueError(f"Target node '{first}' not found")
 
     def _build_adjacency_lists(self) -> None:
         """Build adjacency lists for efficient traversal."""
         self._out_edges: dict[NodeId, list[Edge]] = {
-            node_id: [] for node_id in self.nodes
+            node_id: [] for node_id in self._node_ids
         }  # UP006
         self._in_edges: dict[NodeId, list[Edge]] = {
-            node_id: [] for node_id in self.nodes
+            node_id: [] for node_id in self._node_ids
         }  # UP006
+        successors: dict[NodeId, list[NodeId]] = {
+            node_id: [] for node_id in self._node_ids
+        }
+        predecessors: dict[NodeId, list[NodeId]] = {
+            node_id: [] for node_id in self._node_ids
+        }
 
         for edge in self.edges:
             self._out_edges[edge.source_id].append(edge)
             self._in_edges[edge.target_id].append(edge)
+            successors[edge.source_id].append(edge.target_id)
+            predecessors[edge.target_id].append(edge.source_id)
+
+        self._successors: dict[NodeId, tuple[NodeId, ...]] = {
+            node_id: tuple(ids) for node_id, ids in successors.items()
+        }
+        self._predecessors: dict[NodeId, tuple[NodeId, ...]] = {
+            node_id: tuple(ids) for node_id, ids in predecessors.items()
+        }
+
+        # (target, predicate) per outgoing edge in declaration order, with the
+        # specialized predicate pre-bound; None marks an unconditional edge.
+        # Routing keeps this order, since it decides next-superstep activation.
+        self._routes: dict[NodeId, tuple[tuple[NodeId, Predicate | None], ...]] = {
+            node_id: tuple(
+                (
+                    e.target_id,
+                    None if e.condition is None else specialize_condition(e.condition),
+                )
+                for e in edges
+            )
+            for node_id, edges in self._out_edges.items()
+        }
+        # Value -> targets tables replacing N ``when`` checks with one lookup.
+        # Only when every unconditional edge precedes the conditional ones, so
+        # the lookup can stand in for them without reordering targets.
+        self._branch_tables: dict[NodeId, BranchTable] = {}
+        for node_id, edges in self._out_edges.items():
+            conditional = [e for e in edges if e.condition is not None]
+            if edges[len(edges) - len(conditional) :] != conditional:
+                continue
+            table = _branch_table(conditional)
+            if table is not None:
+                self._branch_tables[node_id] = table
+
+        self._build_csr()
+
+    def _build_csr(self) -> None:
+        """Index nodes as 0..V-1 and store edge targets in CSR form.
+
+        Successors of node ``u`` are ``_col_idx[_row_ptr[u]:_row_ptr[u + 1]]``,
+        in edge insertion order. Graph algorithms run on these flat int lists.
+        """
+        self._idx: dict[NodeId, int] = {
+            node_id: i for i, node_id in enumerate(self._node_ids)
+        }
+        idx = self._idx
+        num_nodes = len(self._node_ids)
+
+        row_ptr = [0] * (num_nodes + 1)
+        for edge in self.edges:
+            row_ptr[idx[edge.source_id] + 1] += 1
+        for u in range(num_nodes):
+            row_ptr[u + 1] += row_ptr[u]
+
+        col_idx = [0] * len(self.edges)
+        indegree = [0] * num_nodes
+        next_slot = row_ptr[:-1]
+        for edge in self.edges:
+            u = idx[edge.source_id]
+            v = idx[edge.target_id]
+            col_idx[next_slot[u]] = v
+            next_slot[u] += 1
+            indegree[v] += 1
+
+        self._row_ptr: list[int] = row_ptr
+        self._col_idx: list[int] = col_idx
+        self._indegree: list[int] = indegree
 
     def get_node(self, node_id: NodeId) -> Node | None:  # UP045
         """Get node by ID."""
@@ -89,56 +265,227 @@ class Graph:
         """Get all incoming edges to a node."""
         return self._in_edges.get(node_id, [])
 
-    def get_successors(self, node_id: NodeId) -> list[NodeId]:  # UP006
+    def get_successors(self, node_id: NodeId) -> tuple[NodeId, ...]:
         """Get direct successor node IDs."""
-        return [edge.target_id for edge in self.get_outgoing_edges(node_id)]
+        return self._successors.get(node_id, _EMPTY)
 
-    def get_predecessors(self, node_id: NodeId) -> list[NodeId]:  # UP006
+    def get_predecessors(self, node_id: NodeId) -> tuple[NodeId, ...]:
         """Get direct predecessor node IDs."""
-        return [edge.source_id for edge in self.get_incoming_edges(node_id)]
+        return self._predecessors.get(node_id, _EMPTY)
+
+    def next_targets(
+        self, node_id: NodeId, outputs: dict[str, Any], state: State
+    ) -> list[NodeId]:
+        """Get the successors that should receive ``outputs`` from a node.
+
+        Targets are listed in edge declaration order: every unconditional
+        edge, plus each conditional edge whose condition holds.
+        """
+        router = self.compile().get(node_id)
+        return [] if router is None else router(outputs, state)
+
+    def compile(self) -> dict[NodeId, Router]:
+        """Return a generated routing function per node, built once.
+
+        ``compile()[node_id](outputs, state)`` returns the targets described in
+        ``next_targets``, with the node's edges inlined as straight-line code.
+        """
+        if self._routers is None:
+            self._routers = self._generate_routers()
+        return self._routers
+
+    def _generate_routers(self) -> dict[NodeId, Router]:
+        namespace: dict[str, Any] = {}
+        lines: list[str] = []
+        for i, node_id in enumerate(self._node_ids):
+            routes = self._routes[node_id]
+            lead = 0
+            while lead < len(routes) and routes[lead][1] is None:
+                lead += 1
+            lines.append(f"def route_{i}(outputs, state):")
+            lines.append(f"    targets = {[t for t, _ in routes[:lead]]!r}")
+            indent = "    "
+            table = self._branch_tables.get(node_id)
+            if table is not None:
+                namespace[f"table_{i}"] = table[1]
+                lines.append("    try:")
+                lines.append(
+                    f"        targets.extend(table_{i}.get(outputs.get({table[0]!r}), ()))"
+                )
+                lines.append("    except TypeError:")
+                indent = "        "
+            for j, (target_id, predicate) in enumerate(routes[lead:]):
+                if predicate is None:
+                    lines.append(f"{indent}targets.append({target_id!r})")
+                    continue
+                namespace[f"cond_{i}_{j}"] = predicate
+                lines.append(f"{indent}if cond_{i}_{j}(outputs, state):")
+                lines.append(f"{indent}    targets.append({target_id!r})")
+            lines.append("    return targets")
+
+        code = compile("\n".join(lines), f"<routers {self.graph_id}>", "exec")
+        exec(code, namespace)
+        return {
+            node_id: namespace[f"route_{i}"] for i, node_id in enumerate(self._node_ids)
+        }
 
     def is_terminal(self, node_id: NodeId) -> bool:
         """Check if node is a terminal/end node."""
         return not self.get_outgoing_edges(node_id)
 
-    def topological_sort(self) -> list[NodeId]:  # UP006
-        """Return nodes in topological order."""
-        visited = set()
-        result = []
-
-        def dfs(node_id: NodeId) -> None:
-            if node_id in visited:
-                return
-            visited.add(node_id)
-            for successor in self.get_successors(node_id):
-                dfs(successor)
-            result.append(node_id)
-
-        dfs(self.start_node)
-        return result
-
-    def validate_cycles(self) -> bool:
-        """Check if graph contains cycles."""
-        visited = set()
-        rec_stack = set()
-
-        def has_cycle(node_id: NodeId) -> bool:
-            visited.add(node_id)
-            rec_stack.add(node_id)
-
-            for neighbor in self.get_successors(node_id):
-                if neighbor not in visited:
-                    if has_cycle(neighbor):
-                        return True
-                elif neighbor in rec_stack:
-                    return True
-
-            rec_stack.remove(node_id)
+    def topological_sort(self, strict: bool = False) -> list[NodeId]:  # UP006
+        """Return nodes in topological order.
+
+        On a cyclic graph, nodes on or downstream of a cycle have no such
+        order; they follow the ordered ones in insertion order, or, with
+        ``strict``, a ValueError is raised instead.
+        """
+        if self._topo_order is None:
+            self._topo_order = self._compute_topological_order()
+        if strict and not self._acyclic:
+            raise ValueError(f"Graph '{self.graph_id}' contains a cycle")
+        return list(self._topo_order)
+
+    def topological_sort_fast(self) -> list[NodeId]:
+        """Return a topological order, using insertion order when it is one.
+
+        Graphs built layer by layer usually list every edge's source before
+        its target; that is checked once, after which this is a plain copy of
+        the node IDs. Otherwise falls back to ``topological_sort``.
+        """
+        if self._insertion_ordered is None:
+            row_ptr = self._row_ptr
+            col_idx = self._col_idx
+            self._insertion_ordered = all(
+                v > u
+                for u in range(len(self._node_ids))
+                for v in col_idx[row_ptr[u] : row_ptr[u + 1]]
+            )
+            if self._insertion_ordered:
+                self._acyclic = True
+        if self._insertion_ordered:
+            return list(self._node_ids)
+        return self.topological_sort()
+
+    def _compute_topological_order(self) -> list[NodeId]:
+        """Kahn's algorithm over the CSR arrays."""
+        order = _kahn_csr(self._row_ptr, self._col_idx, self._indegree)
+        node_ids = self._node_ids
+        self._acyclic = len(order) == len(node_ids)
+        if not self._acyclic:
+            ordered = set(order)
+            order.extend(u for u in range(len(node_ids)) if u not in ordered)
+        return [node_ids[u] for u in order]
+
+    def topological_layers(self) -> list[list[NodeId]]:
+        """Return nodes grouped into topological layers.
+
+        Every node's predecessors lie in earlier layers, so the nodes of one
+        layer are independent and may run concurrently. Raises ValueError if
+        the graph contains a cycle.
+        """
+        if self._acyclic is False:
+            raise ValueError(f"Graph '{self.graph_id}' contains a cycle")
+
+        indegree = list(self._indegree)
+        row_ptr = self._row_ptr
+        col_idx = self._col_idx
+        node_ids = self._node_ids
+
+        layers = []
+        seen = 0
+        layer = [u for u, degree in enumerate(indegree) if degree == 0]
+        while layer:
+            layers.append([node_ids[u] for u in layer])
+            seen += len(layer)
+            next_layer = []
+            for u in layer:
+                for v in col_idx[row_ptr[u] : row_ptr[u + 1]]:
+                    degree = indegree[v] - 1
+                    indegree[v] = degree
+                    if degree == 0:
+                        next_layer.append(v)
+            layer = next_layer
+
+        self._acyclic = seen == len(node_ids)
+        if not self._acyclic:
+            raise ValueError(f"Graph '{self.graph_id}' contains a cycle")
+        return layers
+
+    def can_reach(self, source: NodeId, target: NodeId) -> bool:
+        """Check whether ``target`` is reachable from ``source``.
+
+        Every node reaches itself. Reachability is computed once for the whole
+        graph as one bitset (a Python int) per node, so queries are O(1).
+        """
+        idx = self._idx
+        if source not in idx or target not in idx:
             return False
+        if self._reach is None:
+            self._reach = self._compute_reachability()
+        return bool(self._reach[idx[source]] >> idx[target] & 1)
+
+    def _compute_reachability(self) -> list[int]:
+        """Bit ``v`` of entry ``u`` is set iff node ``v`` is reachable from ``u``."""
+        row_ptr = self._row_ptr
+        col_idx = self._col_idx
+        num_nodes = len(self._node_ids)
+        reach = [1 << u for u in range(num_nodes)]
+
+        order = _kahn_csr(row_ptr, col_idx, self._indegree)
+        if len(order) == num_nodes:
+            # DAG: successors are finished before their predecessors
+            for u in reversed(order):
+                bits = reach[u]
+                for v in col_idx[row_ptr[u] : row_ptr[u + 1]]:
+                    bits |= reach[v]
+                reach[u] = bits
+            return reach
+
+        # Cyclic graph: one traversal per node
+        for root in range(num_nodes):
+            bits = reach[root]
+            stack = [root]
+            while stack:
+                u = stack.pop()
+                for v in col_idx[row_ptr[u] : row_ptr[u + 1]]:
+                    if not bits >> v & 1:
+                        bits |= 1 << v
+                        stack.append(v)
+            reach[root] = bits
+        return reach
 
-        for node_id in self.nodes:
-            if node_id not in visited:
-                if has_cycle(node_id):
+    def validate_cycles(self) -> bool:
+        """Check that the graph is acyclic; returns False if it has a cycle."""
+        if self._acyclic is None:
+            self._acyclic = self._is_acyclic()
+        return self._acyclic
+
+    def _is_acyclic(self) -> bool:
+        """Run the cycle check, bypassing the cache."""
+        # Iterative three-color DFS over node indices:
+        # 0 = unvisited, 1 = on stack, 2 = done
+        row_ptr = self._row_ptr
+        col_idx = self._col_idx
+        color = bytearray(len(self._node_ids))
+
+        for root in range(len(color)):
+            if color[root]:
+                continue
+            color[root] = 1
+            stack = [(root, iter(col_idx[row_ptr[root] : row_ptr[root + 1]]))]
+            while stack:
+                u, targets = stack[-1]
+                v = next(targets, -1)
+                if v < 0:
+                    stack.pop()
+                    color[u] = 2
+                    continue
+                v_color = color[v]
+                if v_color == 0:
+                    color[v] = 1
+                    stack.append((v, iter(col_idx[row_ptr[v] : row_ptr[v + 1]])))
+                elif v_color == 1:
                     return False
         return True
 
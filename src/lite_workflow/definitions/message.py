@@ -5,19 +5,35 @@ Message definitions for LLM communication.
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from typing import Any  # Keep Any, ruff might be overly aggressive for other types
+from typing import (  # Keep Any, ruff might be overly aggressive for other types
+    Any,
+    Iterable,
+)
 
 from typing_extensions import TypeAlias
 
+from .._compat import DATACLASS_SLOTS
+
 # Type aliases
 Role: TypeAlias = str
 Content: TypeAlias = str
 ConditionResult: TypeAlias = bool
 
 
-@dataclass
-class Message:
-    """Represents a message in the workflow."""
+class _SerializedCache:
+    """Holds ``Message``'s serialized form outside its dataclass fields."""
+
+    __slots__ = ("_cached_dict",)
+
+    _cached_dict: dict[str, Any]
+
+
+@dataclass(frozen=True, **DATACLASS_SLOTS)
+class Message(_SerializedCache):
+    """Represents a message in the workflow.
+
+    Messages are immutable; use ``dataclasses.replace`` to derive a new one.
+    """
 
     role: Role
     content: Content
@@ -43,8 +59,20 @@ class Message:
         return cls("system", content, metadata=metadata)
 
     def to_dict(self) -> dict[str, Any]:  # UP006
-        """Convert to dictionary format."""
-        result = {"role": self.role, "content": self.content}
+        """Convert to dictionary format.
+
+        The serialized form is built once per message; each call returns a
+        shallow copy of it.
+        """
+        return dict(self._serialized())
+
+    def _serialized(self) -> dict[str, Any]:
+        """Build, or return the cached, serialized form. Do not mutate it."""
+        try:
+            return self._cached_dict
+        except AttributeError:
+            pass
+        result: dict[str, Any] = {"role": self.role, "content": self.content}
         if self.name is not None:  # Ensure 'name' is only added if it's not None
             result["name"] = self.name
         if self.tool_calls:  # Only add if not empty
@@ -53,10 +81,23 @@ class Message:
             result["tool_call_id"] = self.tool_call_id
         if self.metadata:  # Only add if not empty
             result["metadata"] = self.metadata
+        object.__setattr__(self, "_cached_dict", result)
         return result
 
 
-@dataclass
+def messages_to_payload(messages: Iterable[Message]) -> list[dict[str, Any]]:
+    """Convert a message history to the OpenAI-style list of dicts.
+
+    Each message is serialized once; the payload holds fresh copies.
+    """
+    payload: list[dict[str, Any]] = []
+    append = payload.append
+    for message in messages:
+        append(dict(message._serialized()))
+    return payload
+
+
+@dataclass(**DATACLASS_SLOTS)
 class ChatResult:
     """Represents the result of a chat model interaction."""
 
@@ -5,15 +5,35 @@ Node definitions for workflow computation units.
 from __future__ import annotations
 
 import asyncio
+import dataclasses
+import functools
+import os
+import sys
+from concurrent.futures import Executor
+from contextvars import ContextVar
 from dataclasses import dataclass, field
-from typing import Any, Callable, Protocol
+from operator import itemgetter
+from typing import Any, Awaitable, Callable, Mapping, Protocol, cast
 
 from typing_extensions import TypeAlias
 
+from .._compat import DATACLASS_SLOTS
+
 # Type aliases for clarity
 NodeId: TypeAlias = str
 NodeFunction: TypeAlias = Callable[..., dict[str, Any]]
 
+# Set LITE_WORKFLOW_WRAP_ERRORS=0 to let executor exceptions propagate as-is
+_WRAP_ERRORS = os.environ.get("LITE_WORKFLOW_WRAP_ERRORS", "1") != "0"
+
+# Thread pool for sync executors; None uses the event loop's default executor
+sync_executor: ContextVar[Executor | None] = ContextVar("sync_executor", default=None)
+
+
+def intern_node_id(node_id: NodeId) -> NodeId:
+    """Intern a node ID so repeated dict lookups reuse one string and its hash."""
+    return sys.intern(node_id) if type(node_id) is str else node_id
+
 
 class NodeExecutor(Protocol):
     """Protocol for node execution functions."""
@@ -23,29 +43,47 @@ class NodeExecutor(Protocol):
         ...
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class NodeConfig:
-    """Configuration for node execution."""
+    """Configuration for node execution.
+
+    ``inline_sync`` runs a sync executor directly on the event loop instead of
+    in a worker thread. Only use it for fast, non-blocking executors: while
+    one runs, nothing else on the loop can make progress.
+    """
 
     timeout: float | None = None
     retry_count: int = 0
     retry_delay: float = 1.0
     metadata: dict[str, Any] = field(default_factory=dict)
+    inline_sync: bool = False
 
 
 class Node:
     """Abstract base class for all workflow nodes."""
 
+    __slots__ = (
+        "node_id",
+        "executor",
+        "config",
+        "_is_coro",
+        "_inline",
+    )
+
     def __init__(
         self,
         node_id: NodeId,
         executor: NodeExecutor,
         config: NodeConfig | None = None,
     ):
-        self.node_id = node_id
+        self.node_id = intern_node_id(node_id)
         self.executor = executor
         self.config = config or NodeConfig()
         self._validate()
+        self._is_coro = asyncio.iscoroutinefunction(executor)
+        # A thread hop is pure overhead for tiny executors; a timeout still
+        # needs the thread so the loop stays free to enforce it
+        self._inline = self.config.inline_sync and self.config.timeout is None
 
     def _validate(self) -> None:
         """Validate node configuration."""
@@ -54,20 +92,39 @@ class Node:
         if not callable(self.executor):
             raise ValueError("Executor must be callable")
 
+    async def _execute(self, inputs: dict[str, Any], **context: Any) -> dict[str, Any]:
+        """Run the executor: awaited, inline, or in a worker thread."""
+        if self._is_coro:
+            result = cast("Awaitable[dict[str, Any]]", self.executor(inputs, **context))
+            return await result
+        if self._inline:
+            return self.executor(inputs, **context)
+        pool = sync_executor.get()
+        if pool is None:
+            return await asyncio.to_thread(self.executor, inputs, **context)
+        return await asyncio.get_running_loop().run_in_executor(
+            pool, functools.partial(self.executor, inputs, **context)
+        )
+
     async def execute_async(
         self, inputs: dict[str, Any], **context: Any
     ) -> dict[str, Any]:
-        """Execute node asynchronously, handling both async and sync executors."""
+        """Execute node asynchronously, handling both async and sync executors.
+
+        Failures are raised as NodeExecutionError, unless the process was
+        started with LITE_WORKFLOW_WRAP_ERRORS=0, in which case the executor's
+        own exception propagates without the extra wrapping layer.
+        """
         try:
-            if asyncio.iscoroutinefunction(self.executor):
-                return await self.executor(inputs, **context)
-            else:
-                return await asyncio.to_thread(self.executor, inputs, **context)
+            return await self._execute(inputs, **context)
         except Exception as e:
             raise NodeExecutionError(
                 f"Node {self.node_id} execution failed: {str(e)}"
             ) from e
 
+    if not _WRAP_ERRORS:
+        execute_async = _execute  # noqa: F811
+
     def __repr__(self) -> str:
         return f"{self.__class__.__name__}(id='{self.node_id}')"
 
@@ -83,6 +140,93 @@ def create_function_node(
     node_id: NodeId,
     func: Callable[..., dict[str, Any]],
     config: NodeConfig | None = None,
+    reads: tuple[str, ...] | None = None,
+    defaults: Mapping[str, Any] | None = None,
+    output_type: type | None = None,
 ) -> Node:
-    """Create a node from a Python function (sync or async)."""
+    """Create a node from a Python function (sync or async).
+
+    With ``reads``, ``func`` is called with those input values as positional
+    arguments instead of the inputs dict. Keys missing from the inputs take
+    their value from ``defaults``, or None.
+
+    With ``output_type`` (a NamedTuple or dataclass), dict results are built
+    into that record, so a missing or unexpected key fails the node.
+    """
+    if output_type is not None:
+        func = _coerce_outputs(func, output_type)
+    if reads:
+        func = _bind_reads(func, tuple(reads), defaults or {})
     return Node(node_id=node_id, executor=func, config=config)
+
+
+def output_to_dict(outputs: Any) -> dict[str, Any]:
+    """Return node outputs as a dict; NamedTuple and dataclass records are unpacked."""
+    if type(outputs) is dict:
+        return outputs
+    return _record_converter(type(outputs))(outputs)
+
+
+def _build_record_converter(cls: type) -> Callable[[Any], dict[str, Any]]:
+    """Build a record -> dict converter for ``cls``."""
+    if issubclass(cls, tuple) and hasattr(cls, "_fields"):
+        names = cls._fields
+        return lambda record: dict(zip(names, record))
+    if dataclasses.is_dataclass(cls):
+        names = tuple(f.name for f in dataclasses.fields(cls))
+        return lambda record: {name: getattr(record, name) for name in names}
+    return dict
+
+
+# One converter per record type; typed explicitly since lru_cache's signature
+# would demand Hashable arguments
+_record_converter: Callable[[type], Callable[[Any], dict[str, Any]]] = (
+    functools.lru_cache(maxsize=None)(_build_record_converter)
+)
+
+
+def _coerce_outputs(func: Callable[..., Any], output_type: type) -> Callable[..., Any]:
+    """Wrap ``func`` so dict results are built into ``output_type``."""
+
+    def coerce(result: Any) -> Any:
+        return output_type(**result) if type(result) is dict else result
+
+    if asyncio.iscoroutinefunction(func):
+
+        async def async_executor(*args: Any, **context: Any) -> Any:
+            return coerce(await func(*args, **context))
+
+        return functools.update_wrapper(async_executor, func)
+
+    def executor(*args: Any, **context: Any) -> Any:
+        return coerce(func(*args, **context))
+
+    return functools.update_wrapper(executor, func)
+
+
+def _bind_reads(
+    func: Callable[..., Any], reads: tuple[str, ...], defaults: Mapping[str, Any]
+) -> Callable[..., Any]:
+    """Wrap ``func`` so it receives ``reads`` unpacked from the inputs dict."""
+    getter = itemgetter(*reads)
+    fallback = {key: defaults.get(key) for key in reads}
+    single = len(reads) == 1
+
+    def extract(inputs: dict[str, Any]) -> tuple[Any, ...]:
+        try:
+            values = getter(inputs)
+        except KeyError:
+            values = getter({**fallback, **inputs})
+        return (values,) if single else values
+
+    if asyncio.iscoroutinefunction(func):
+
+        async def async_executor(inputs: dict[str, Any], **context: Any) -> Any:
+            return await func(*extract(inputs), **context)
+
+        return functools.update_wrapper(async_executor, func)
+
+    def executor(inputs: dict[str, Any], **context: Any) -> Any:
+        return func(*extract(inputs), **context)
+
+    return functools.update_wrapper(executor, func)
@@ -4,10 +4,13 @@ State management for workflow execution.
 
 from __future__ import annotations
 
+import keyword
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from enum import Enum
-from typing import Any
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Any, Iterable, Mapping
 
 from typing_extensions import TypeAlias
 
@@ -19,6 +22,8 @@ StateValue: TypeAlias = Any
 class State(ABC):
     """Abstract base class for state management."""
 
+    __slots__ = ()
+
     @abstractmethod
     def get(self, key: StateKey, default: StateValue = None) -> StateValue:
         """Get state value by key."""
@@ -56,31 +61,156 @@ class UpdateStrategy(Enum):
 
 @dataclass
 class InMemoryState(State):
-    """Simple in-memory state implementation."""
+    """Simple in-memory state implementation.
+
+    The backing dict is copy-on-write once shared (see ``shared`` and
+    ``snapshot``): the first mutation afterwards copies it, so views handed
+    out earlier never change.
+    """
 
     def __init__(self, initial_data: dict[StateKey, StateValue] | None = None):
         self._data: dict[StateKey, StateValue] = initial_data or {}
+        # Bound once so reads skip the attribute walk to ``_data.get``
+        self._fast_get = self._data.get
+        self._shared = False
+
+    @classmethod
+    def shared(cls, data: dict[StateKey, StateValue]) -> InMemoryState:
+        """Wrap ``data`` without taking ownership; it is copied on first write."""
+        state = cls(data)
+        state._shared = True
+        return state
+
+    def _own(self) -> dict[StateKey, StateValue]:
+        """Return the backing dict, copying it first if it is shared."""
+        if self._shared:
+            self._data = dict(self._data)
+            self._fast_get = self._data.get
+            self._shared = False
+        return self._data
 
     def get(self, key: StateKey, default: StateValue = None) -> StateValue:
-        return self._data.get(key, default)
+        return self._fast_get(key, default)
+
+    def __getitem__(self, key: StateKey) -> StateValue:
+        return self._data[key]
+
+    def __contains__(self, key: StateKey) -> bool:
+        return key in self._data
 
     def set(self, key: StateKey, value: StateValue) -> None:
-        self._data[key] = value
+        self._own()[key] = value
 
     def update(self, updates: dict[StateKey, StateValue]) -> None:
         """Update multiple state values."""
-        self._data.update(updates)
+        self._own().update(updates)
 
     def delete(self, key: StateKey) -> None:
         """Delete state value by key."""
-        self._data.pop(key, None)
+        if key in self._data:
+            self._own().pop(key, None)
 
     def to_dict(self) -> dict[StateKey, StateValue]:
         """Convert state to dictionary."""
         return self._data.copy()
 
+    def snapshot(self) -> Mapping[StateKey, StateValue]:
+        """Return a read-only view of the current state without copying it."""
+        self._shared = True
+        return MappingProxyType(self._data)
+
     def __len__(self) -> int:
         return len(self._data)
 
     def __repr__(self) -> str:
         return f"InMemoryState({len(self)} keys)"
+
+
+_MISSING = object()
+
+
+class SlottedState(State):
+    """State stored in ``__slots__`` for a fixed, known set of keys.
+
+    Use :meth:`for_keys` to build a concrete class for a schema. Reads and
+    writes go through slot descriptors instead of a dict; writing a key
+    outside the schema raises ``KeyError``.
+    """
+
+    __slots__ = ()
+    _keys: tuple[StateKey, ...] = ()
+    _keyset: frozenset[StateKey] = frozenset()
+
+    def __init__(self, initial_data: dict[StateKey, StateValue] | None = None):
+        if initial_data:
+            self.update(initial_data)
+
+    @staticmethod
+    def for_keys(keys: Iterable[StateKey]) -> type[SlottedState]:
+        """Return the (cached) slotted state class for ``keys``.
+
+        Raises ``ValueError`` if a key is not usable as a slot name.
+        """
+        return _slotted_state_class(tuple(dict.fromkeys(keys)))
+
+    def get(self, key: StateKey, default: StateValue = None) -> StateValue:
+        if key not in self._keyset:
+            return default
+        return getattr(self, key, default)
+
+    def set(self, key: StateKey, value: StateValue) -> None:
+        if key not in self._keyset:
+            raise KeyError(key)
+        setattr(self, key, value)
+
+    def update(self, updates: dict[StateKey, StateValue]) -> None:
+        """Update multiple state values."""
+        for key, value in updates.items():
+            self.set(key, value)
+
+    def delete(self, key: StateKey) -> None:
+        """Delete state value by key."""
+        if key in self._keyset and hasattr(self, key):
+            delattr(self, key)
+
+    def to_dict(self) -> dict[StateKey, StateValue]:
+        """Convert state to dictionary."""
+        data = {}
+        for key in self._keys:
+            value = getattr(self, key, _MISSING)
+            if value is not _MISSING:
+                data[key] = value
+        return data
+
+    def __getitem__(self, key: StateKey) -> StateValue:
+        value = self.get(key, _MISSING)
+        if value is _MISSING:
+            raise KeyError(key)
+        return value
+
+    def __contains__(self, key: StateKey) -> bool:
+        return key in self._keyset and hasattr(self, key)
+
+    def __len__(self) -> int:
+        return sum(1 for key in self._keys if hasattr(self, key))
+
+    def __repr__(self) -> str:
+        return f"SlottedState({len(self)}/{len(self._keys)} keys)"
+
+
+@lru_cache(maxsize=None)
+def _slotted_state_class(keys: tuple[StateKey, ...]) -> type[SlottedState]:
+    for key in keys:
+        if (
+            not isinstance(key, str)
+            or not key.isidentifier()
+            or keyword.iskeyword(key)
+            or key.startswith("__")
+            or hasattr(SlottedState, key)
+        ):
+            raise ValueError(f"State key {key!r} cannot be used as a slot")
+    return type(
+        "SlottedState",
+        (SlottedState,),
+        {"__slots__": keys, "_keys": keys, "_keyset": frozenset(keys)},
+    )
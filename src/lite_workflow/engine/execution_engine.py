@@ -8,26 +8,24 @@ from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from typing import Any
 
+from .._compat import DATACLASS_SLOTS
 from ..core.error_handler import ErrorHandler
 from ..core.logger import Logger
 from ..core.state_manager import StateManager
 from ..definitions.graph import Graph
 
 
-@dataclass
+@dataclass(frozen=True, **DATACLASS_SLOTS)
 class ExecutionConfig:
-    """Configuration for workflow execution."""
+    """Configuration for workflow execution (immutable once created)."""
 
     max_iterations: int = 1000
     timeout: float | None = None
     enable_parallel: bool = False
+    max_workers: int | None = None
     checkpoint_interval: int = 10
     metadata: dict[str, Any] = field(default_factory=dict)
 
-    def __post_init__(self):
-        if self.metadata is None:
-            self.metadata = {}
-
 
 class ExecutionEngine(ABC):
     """Abstract base class for all workflow execution engines."""
@@ -6,60 +6,76 @@ Implements the "think like a vertex" paradigm for workflow execution.
 from __future__ import annotations
 
 import asyncio
+import reprlib
 import time
-from collections import defaultdict
-from dataclasses import dataclass
-from typing import Any
+from array import array
+from concurrent.futures import ThreadPoolExecutor
+from types import MappingProxyType
+from typing import Any, Mapping, Sequence
 
-from ..core.event_bus import Event, EventBus
+from .._compat import ASYNCIO_RUNNER, EAGER_TASK_FACTORY, TASK_GROUP
+from ..core.event_bus import EVT_NODE_EXECUTION, EVT_SUPERSTEP, Event, EventBus
 from ..core.logger import Logger
 from ..definitions.graph import NodeId
+from ..definitions.node import output_to_dict, sync_executor
 from ..definitions.state import State
 from .execution_engine import ExecutionEngine
 
+_EMPTY: Mapping[str, Any] = MappingProxyType({})
+
 
-@dataclass
 class SuperStepEvent(Event):
     """Event emitted at the start/end of a superstep."""
 
+    __slots__ = ("superstep", "active_nodes", "completed_nodes", "metadata")
+
     def __init__(
         self,
         superstep: int,
         active_nodes: list[NodeId],
         completed_nodes: list[NodeId],
-        metadata: dict[str, Any] | None = None,
+        metadata: Mapping[str, Any] | None = None,
     ):
-        super().__init__(
-            event_type="superstep",
-            data={
-                "superstep": superstep,
-                "active_nodes": active_nodes,
-                "completed_nodes": completed_nodes,
-                "metadata": metadata or {},
-            },
-        )
+        super().__init__(EVT_SUPERSTEP)
+        self.superstep = superstep
+        self.active_nodes = active_nodes
+        self.completed_nodes = completed_nodes
+        self.metadata = metadata or _EMPTY
+
+    def _build_data(self) -> dict[str, Any]:
+        return {
+            "superstep": self.superstep,
+            "active_nodes": self.active_nodes,
+            "completed_nodes": self.completed_nodes,
+            "metadata": self.metadata,
+        }
 
 
-@dataclass
 class NodeExecutionEvent(Event):
     """Event emitted when a node completes execution."""
 
+    __slots__ = ("node_id", "duration", "outputs", "metadata")
+
     def __init__(
         self,
         node_id: NodeId,
         duration: float,
         outputs: dict[str, Any],
-        metadata: dict[str, Any] | None = None,
+        metadata: Mapping[str, Any] | None = None,
     ):
-        super().__init__(
-            event_type="node_execution",
-            data={
-                "node_id": node_id,
-                "duration": duration,
-                "outputs": outputs,
-                "metadata": metadata or {},
-            },
-        )
+        super().__init__(EVT_NODE_EXECUTION)
+        self.node_id = node_id
+        self.duration = duration
+        self.outputs = outputs
+        self.metadata = metadata or _EMPTY
+
+    def _build_data(self) -> dict[str, Any]:
+        return {
+            "node_id": self.node_id,
+            "duration": self.duration,
+            "outputs": self.outputs,
+            "metadata": self.metadata,
+        }
 
 
 class PregelEngine(ExecutionEngine):
@@ -77,12 +93,31 @@ class PregelEngine(ExecutionEngine):
         super().__init__(*args, **kwargs)
         self.logger = Logger("pregel_engine")
         self.event_bus = EventBus()
+        self._routers = self.graph.compile()
+        self._pool: ThreadPoolExecutor | None = None
+        self._event_queue: asyncio.Queue[Event | Sequence[Event]] | None = None
+        # Node outputs of the running superstep, published together at its
+        # barrier so state is copied once per superstep rather than per node
+        self._pending_updates: list[tuple[dict[str, Any], str]] = []
+        # Double-buffered message queues, one list per node: superstep k reads
+        # one buffer while filling the other, and the lists are reused
+        self._msg_buffers: tuple[dict[NodeId, list[dict[str, Any]]], ...] = tuple(
+            {node_id: [] for node_id in self.graph.nodes} for _ in range(2)
+        )
+        # Nodes with a non-empty queue in the matching buffer, in the order
+        # they first received a message
+        self._active_buffers: tuple[list[NodeId], ...] = ([], [])
+        self._node_ids = tuple(self.graph.nodes)
+        self._node_index = {node_id: i for i, node_id in enumerate(self._node_ids)}
+        # State update source tag per node, formatted once
+        self._source_tags = {node_id: f"node_{node_id}" for node_id in self._node_ids}
+        # Last duration per node in ns, indexed by position; -1 means not run
+        self._durations_ns = array("q", [-1]) * len(self._node_ids)
         self._execution_stats = {
             "start_time": None,
             "end_time": None,
             "total_supersteps": 0,
             "total_nodes_executed": 0,
-            "node_execution_times": {},
             "messages_sent": 0,
         }
 
@@ -97,48 +132,91 @@ class PregelEngine(ExecutionEngine):
         current_messages = self._initialize_messages()
         superstep = 0
 
-        while superstep < self.config.max_iterations:
-            # Check termination conditions
-            if not any(current_messages.values()):
-                break
-
-            # Execute superstep
-            new_messages = await self._execute_superstep_async(
-                current_messages, superstep
-            )
+        token = (
+            sync_executor.set(self._get_pool()) if self.config.enable_parallel else None
+        )
+        max_iterations = self.config.max_iterations
+        # Engine events are delivered in order by a background task, so slow
+        # subscribers do not hold up the supersteps
+        event_queue: asyncio.Queue[Event | Sequence[Event]] = asyncio.Queue()
+        self._event_queue = event_queue
+        event_worker = asyncio.ensure_future(self._drain_events(event_queue))
+        try:
+            try:
+                while superstep < max_iterations:
+                    # Check termination conditions
+                    if not self._active_buffers[superstep % 2]:
+                        break
+
+                    # Execute superstep
+                    new_messages = await self._execute_superstep_async(
+                        current_messages, superstep
+                    )
 
-            current_messages = new_messages
-            superstep += 1
-            self._execution_stats["total_supersteps"] = superstep
+                    current_messages = new_messages
+                    superstep += 1
+                    self._execution_stats["total_supersteps"] = superstep
+            except Exception:
+                # A failed run still delivers the events it already emitted
+                await event_queue.join()
+                raise
+            await event_queue.join()
+        finally:
+            event_worker.cancel()
+            self._event_queue = None
+            if token is not None:
+                sync_executor.reset(token)
+            # The pool is per run; leaving it open would leak its threads
+            # every time a workflow builds a fresh engine
+            if self._pool is not None:
+                self._pool.shutdown(wait=False)
+                self._pool = None
 
         end_time = time.time()
         self._execution_stats["end_time"] = end_time
 
         final_state = self.state_manager.get_state()
         self.logger.log_workflow_complete(
-            self.graph.graph_id, end_time - start_time, final_state.to_dict()
+            self.graph.graph_id, end_time - start_time, self.state_manager.snapshot()
         )
 
         return final_state
 
+    def _get_pool(self) -> ThreadPoolExecutor:
+        """Dedicated pool for sync nodes, created per parallel run."""
+        if self._pool is None:
+            self._pool = ThreadPoolExecutor(
+                max_workers=self.config.max_workers or max(len(self.graph), 1),
+                thread_name_prefix=f"lite-workflow-{self.graph.graph_id}",
+            )
+        return self._pool
+
     def execute(self) -> State:
-        """Execute workflow synchronously."""
-        # Run async version in sync context
-        try:
-            loop = asyncio.get_event_loop()
-            return loop.run_until_complete(self.execute_async())
-        except RuntimeError:
-            # No event loop, create new one
+        """Execute workflow synchronously in a new event loop.
+
+        Where supported, node tasks start eagerly so nodes that finish without
+        suspending skip a trip through the event loop.
+        """
+        if EAGER_TASK_FACTORY is None or ASYNCIO_RUNNER is None:
             return asyncio.run(self.execute_async())
+        with ASYNCIO_RUNNER() as runner:
+            runner.get_loop().set_task_factory(EAGER_TASK_FACTORY)
+            return runner.run(self.execute_async())
 
     def _initialize_messages(self) -> dict[NodeId, list[dict[str, Any]]]:
         """Initialize message queues for the first superstep."""
-        messages = defaultdict(list)
+        for buffer in self._msg_buffers:
+            for queue in buffer.values():
+                queue.clear()
+        for active in self._active_buffers:
+            active.clear()
+        messages = self._msg_buffers[0]
 
         # Send initial state to start node
         start_node = self.graph.start_node
-        initial_data = self.state_manager.get_state().to_dict()
+        initial_data = dict(self.state_manager.snapshot())
         messages[start_node].append(initial_data)
+        self._active_buffers[0].append(start_node)
 
         return messages
 
@@ -146,65 +224,195 @@ class PregelEngine(ExecutionEngine):
         self, messages: dict[NodeId, list[dict[str, Any]]], superstep: int
     ) -> dict[NodeId, list[dict[str, Any]]]:
         """Execute a single superstep asynchronously."""
-        active_nodes = [node_id for node_id, msgs in messages.items() if msgs]
+        active_nodes = list(self._active_buffers[superstep % 2])
 
-        print(f"⚙️ 超步 {superstep}: 活跃节点 {active_nodes}")
+        self.logger.debug("Superstep %d: active nodes %s", superstep, active_nodes)
 
-        self.event_bus.emit(
-            SuperStepEvent(
-                superstep=superstep, active_nodes=active_nodes, completed_nodes=[]
+        if self.event_bus.has_handlers(EVT_SUPERSTEP):
+            self._post_event(
+                SuperStepEvent(
+                    superstep=superstep, active_nodes=active_nodes, completed_nodes=[]
+                )
             )
-        )
-
-        # Execute all active nodes in parallel
-        tasks = []
-        for node_id in active_nodes:
-            task = self._execute_node_async(node_id, messages[node_id], superstep)
-            tasks.append(task)
-
-        # Wait for all executions to complete
-        results = await asyncio.gather(*tasks, return_exceptions=True)
 
-        # Collect new messages
-        new_messages = defaultdict(list)
+        # Execute all active nodes in parallel; recovery runs inside each
+        # node's task, so only unrecoverable failures abort the superstep
+        results: dict[NodeId, dict[str, Any] | None] = {}
+        try:
+            if TASK_GROUP is not None:
+                # Tasks never raise, so the group never cancels this task; an
+                # aborting group can leave a stale cancellation behind when
+                # eager tasks fail synchronously (CPython 3.12)
+                async with TASK_GROUP() as group:
+                    tasks = [
+                        group.create_task(
+                            self._settle_node_async(
+                                node_id, messages[node_id], superstep
+                            )
+                        )
+                        for node_id in active_nodes
+                    ]
+                for task in tasks:
+                    node_id, outputs, error = task.result()
+                    if error is not None:
+                        raise error
+                    results[node_id] = outputs
+            else:
+                await self._gather_nodes(active_nodes, messages, superstep, results)
+        finally:
+            pending = self._pending_updates
+            self._pending_updates = []
+            self.state_manager.update_many(pending)
+
+        # Route in activation order so message merging stays deterministic
+        new_messages = self._msg_buffers[(superstep + 1) % 2]
+        new_active = self._active_buffers[(superstep + 1) % 2]
+        # Only queues filled two supersteps ago can be non-empty
+        for node_id in new_active:
+            new_messages[node_id].clear()
+        new_active.clear()
         completed_nodes = []
 
-        for node_id, result in zip(active_nodes, results):
-            if isinstance(result, Exception):
-                # Handle error
-                try:
-                    recovery_result = await self.error_handler.handle_error_async(
-                        node_id, result, {"superstep": superstep}
-                    )
-                    if recovery_result:
-                        result = recovery_result
-                    else:
-                        continue
-                except Exception as e:
-                    raise RuntimeError(f"Node {node_id} failed permanently: {e}") from e
+        # Routing happens after the barrier, so every node sees the same state
+        state = self.state_manager.get_state()
+        routers = self._routers
+        event_bus = self.event_bus
+        node_events: list[NodeExecutionEvent] | None = (
+            []
+            if event_bus.has_handlers(EVT_NODE_EXECUTION)
+            or event_bus.has_handlers(EVT_SUPERSTEP)
+            else None
+        )
+        messages_sent = 0
+        append_active = new_active.append
+        for node_id in active_nodes:
+            node_outputs = results[node_id]
+            if node_outputs is None:
+                continue
 
             completed_nodes.append(node_id)
+            if node_events is not None:
+                node_events.append(
+                    NodeExecutionEvent(
+                        node_id=node_id,
+                        duration=self._durations_ns[self._node_index[node_id]] / 1e9,
+                        outputs=node_outputs,
+                    )
+                )
 
             # Send messages to neighbors
-            node_outputs = result
-            outgoing_edges = self.graph.get_outgoing_edges(node_id)
-
-            for edge in outgoing_edges:
-                if edge.should_traverse(node_outputs, self.state_manager.get_state()):
-                    new_messages[edge.target_id].append(node_outputs)
-                    self._execution_stats["messages_sent"] += 1
-
-        # Update execution stats
-        self.event_bus.emit(
-            SuperStepEvent(
-                superstep=superstep,
-                active_nodes=active_nodes,
-                completed_nodes=completed_nodes,
+            targets = routers[node_id](node_outputs, state)
+
+            for target_id in targets:
+                queue = new_messages[target_id]
+                if not queue:
+                    append_active(target_id)
+                queue.append(node_outputs)
+            messages_sent += len(targets)
+
+        self._execution_stats["messages_sent"] += messages_sent
+
+        # One batched dispatch for the superstep's node events; the end event
+        # also carries them for subscribers that want the whole batch
+        if node_events:
+            self._post_event(node_events)
+        if event_bus.has_handlers(EVT_SUPERSTEP):
+            self._post_event(
+                SuperStepEvent(
+                    superstep=superstep,
+                    active_nodes=active_nodes,
+                    completed_nodes=completed_nodes,
+                    metadata={"node_events": node_events} if node_events else None,
+                )
             )
-        )
 
         return new_messages
 
+    async def _gather_nodes(
+        self,
+        active_nodes: list[NodeId],
+        messages: dict[NodeId, list[dict[str, Any]]],
+        superstep: int,
+        results: dict[NodeId, dict[str, Any] | None],
+    ) -> None:
+        """Run nodes without ``TaskGroup``, cancelling the rest on failure."""
+        tasks = [
+            asyncio.ensure_future(
+                self._run_node_async(node_id, messages[node_id], superstep)
+            )
+            for node_id in active_nodes
+        ]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                node_id, outputs = await next_done
+                results[node_id] = outputs
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            raise
+
+    def _post_event(self, item: Event | Sequence[Event]) -> None:
+        """Queue an event, or a batch of them, for background delivery.
+
+        Outside ``execute_async`` the item is delivered immediately.
+        """
+        if self._event_queue is not None:
+            # Stamp at emit time; delivery may happen supersteps later
+            if isinstance(item, Event):
+                item.stamp()
+            else:
+                for event in item:
+                    event.stamp()
+            self._event_queue.put_nowait(item)
+        elif isinstance(item, Event):
+            self.event_bus.emit(item)
+        else:
+            self.event_bus.emit_many(item)
+
+    async def _drain_events(
+        self, queue: asyncio.Queue[Event | Sequence[Event]]
+    ) -> None:
+        """Deliver queued engine events in order until cancelled."""
+        event_bus = self.event_bus
+        while True:
+            item = await queue.get()
+            try:
+                if isinstance(item, Event):
+                    await event_bus.emit_async(item)
+                else:
+                    await event_bus.emit_many_async(item)
+            finally:
+                queue.task_done()
+
+    async def _settle_node_async(
+        self, node_id: NodeId, messages: list[dict[str, Any]], superstep: int
+    ) -> tuple[NodeId, dict[str, Any] | None, Exception | None]:
+        """Like ``_run_node_async``, but return an unrecoverable error."""
+        try:
+            _, outputs = await self._run_node_async(node_id, messages, superstep)
+        except Exception as error:
+            return node_id, None, error
+        return node_id, outputs, None
+
+    async def _run_node_async(
+        self, node_id: NodeId, messages: list[dict[str, Any]], superstep: int
+    ) -> tuple[NodeId, dict[str, Any] | None]:
+        """Execute a node, applying error recovery on failure.
+
+        Returns ``(node_id, outputs)``; outputs is None when the failure was
+        handled without a result. Unrecoverable failures raise RuntimeError.
+        """
+        try:
+            return node_id, await self._execute_node_async(node_id, messages, superstep)
+        except Exception as error:
+            try:
+                recovery_result = await self.error_handler.handle_error_async(
+                    node_id, error, {"superstep": superstep}
+                )
+            except Exception as e:
+                raise RuntimeError(f"Node {node_id} failed permanently: {e}") from e
+            return node_id, recovery_result or None
+
     async def _execute_node_async(
         self, node_id: NodeId, messages: list[dict[str, Any]], superstep: int
     ) -> dict[str, Any]:
@@ -213,32 +421,35 @@ class PregelEngine(ExecutionEngine):
         if not node:
             raise ValueError(f"Node {node_id} not found")
 
-        # Aggregate messages
-        aggregated_input = {}
-        for message in messages:
-            aggregated_input.update(message)
-
-        print(f"ℹ️ 节点 {node_id} (超步 {superstep}) 聚合输入: {aggregated_input}")
+        if self.logger.debug_enabled:
+            self.logger.debug(
+                "Node %s (superstep %d) inputs: %s",
+                node_id,
+                superstep,
+                reprlib.repr(messages),
+            )
 
-        # Add current state context
-        full_context = {
-            **self.state_manager.get_state().to_dict(),
-            **aggregated_input,
-            "__superstep": superstep,
-            "__node_id": node_id,
-        }
+        # Current state overlaid with the incoming messages, built in place:
+        # one copy of the state, then one bulk update per message
+        full_context = dict(self.state_manager.snapshot())
+        for message in messages:
+            full_context.update(message)
+        full_context["__superstep"] = superstep
+        full_context["__node_id"] = node_id
 
         # Execute node
-        start_time = time.time()
+        start_ns = time.perf_counter_ns()
 
         try:
-            outputs = await node.execute_async(full_context)
+            # Records are unpacked once here; state and routing work on dicts
+            outputs = output_to_dict(await node.execute_async(full_context))
 
-            # Update global state
-            self.state_manager.update(outputs, source=f"node_{node_id}")
+            # Staged for the superstep barrier
+            self._pending_updates.append((outputs, self._source_tags[node_id]))
 
-            duration = time.time() - start_time
-            self._execution_stats["node_execution_times"][node_id] = duration
+            self._durations_ns[self._node_index[node_id]] = (
+                time.perf_counter_ns() - start_ns
+            )
             self._execution_stats["total_nodes_executed"] += 1
 
             return outputs
@@ -250,6 +461,11 @@ class PregelEngine(ExecutionEngine):
         """Get comprehensive execution statistics."""
         stats = self._execution_stats.copy()
         stats["total_duration"] = stats["end_time"] - stats["start_time"]
+        stats["node_execution_times"] = {
+            node_id: duration_ns / 1e9
+            for node_id, duration_ns in zip(self._node_ids, self._durations_ns)
+            if duration_ns >= 0
+        }
         return stats
 
     def get_progress(self) -> dict[str, Any]:
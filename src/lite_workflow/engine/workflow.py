@@ -7,20 +7,21 @@ from __future__ import annotations
 from dataclasses import dataclass
 from typing import Any, Callable
 
+from .._compat import DATACLASS_SLOTS
 from ..core.error_handler import ErrorHandler
 from ..core.state_manager import StateManager
 from ..definitions.edge import Edge
 from ..definitions.graph import Graph
 from ..definitions.node import Node, create_function_node
-from ..definitions.state import InMemoryState, State
+from ..definitions.state import State
 from .pregel_engine import PregelEngine
 
 
-@dataclass
+@dataclass(frozen=True, **DATACLASS_SLOTS)
 class WorkflowResult:
-    """Result of workflow execution."""
+    """Result of workflow execution; ``final_state`` is None when it failed."""
 
-    final_state: State
+    final_state: State | None
     execution_stats: dict[str, Any]
     success: bool
     error: str | None = None
@@ -39,6 +40,8 @@ class Workflow:
         self.edges: list[Edge] = []
         self.initial_state = initial_state or {}
         self._start_node: str | None = None
+        # Built graph, reused across runs until the definition changes
+        self._graph: Graph | None = None
 
     def add_node(
         self, node_id: str, func: Callable[..., dict[str, Any]], **kwargs: Any
@@ -46,6 +49,7 @@ class Workflow:
         """Add a function node to the workflow."""
         node = create_function_node(node_id, func)
         self.nodes.append(node)
+        self._graph = None
 
         if not self._start_node:
             self._start_node = node_id
@@ -56,11 +60,13 @@ class Workflow:
         """Add an edge between nodes."""
         edge = Edge(source_id=source, target_id=target, **kwargs)
         self.edges.append(edge)
+        self._graph = None
         return self
 
     def set_start_node(self, node_id: str) -> Workflow:
         """Set the start node for the workflow."""
         self._start_node = node_id
+        self._graph = None
         return self
 
     def chain(self, *nodes: str) -> Workflow:
@@ -70,16 +76,35 @@ class Workflow:
         return self
 
     def build_graph(self) -> Graph:
-        """Build the graph from current workflow definition."""
+        """Build the graph from current workflow definition.
+
+        The graph, along with everything it caches (routing, topology), is
+        reused until a node or edge is added or the start node changes.
+        Mutating ``nodes`` or ``edges`` directly bypasses this.
+        """
         if not self._start_node:
             raise ValueError("Start node must be set")
 
-        return Graph(
-            graph_id=self.name,
-            nodes=self.nodes,
-            edges=self.edges,
-            start_node=self._start_node,
-        )
+        if self._graph is None:
+            self._graph = Graph(
+                graph_id=self.name,
+                nodes=self.nodes,
+                edges=self.edges,
+                start_node=self._start_node,
+            )
+        return self._graph
+
+    def compile(self) -> Graph:
+        """Build the graph ahead of the first run and precompute its caches.
+
+        Generates the per-node routers and, for acyclic graphs, the
+        topological order, so the first ``run`` pays only for execution.
+        """
+        graph = self.build_graph()
+        graph.compile()
+        if graph.validate_cycles():
+            graph.topological_sort()
+        return graph
 
     def run(self, **kwargs: Any) -> WorkflowResult:
         """Run the workflow."""
@@ -100,7 +125,7 @@ class Workflow:
 
         except Exception as e:
             return WorkflowResult(
-                final_state=InMemoryState({}),
+                final_state=None,
                 execution_stats={},
                 success=False,
                 error=str(e),
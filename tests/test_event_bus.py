@@ -0,0 +1,114 @@
+"""Tests for async handler delivery through the event bus and engine."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+
+import pytest
+
+from lite_workflow import Workflow
+from lite_workflow.core.error_handler import ErrorHandler
+from lite_workflow.core.event_bus import (
+    EVT_NODE_EXECUTION,
+    EVT_SUPERSTEP,
+    Event,
+    EventBus,
+)
+from lite_workflow.core.state_manager import StateManager
+from lite_workflow.engine.pregel_engine import PregelEngine
+
+
+def _build_engine() -> PregelEngine:
+    workflow = Workflow("events", {"value": 1})
+    workflow.add_node("double", lambda inputs: {"value": inputs["value"] * 2})
+    workflow.add_node("increment", lambda inputs: {"value": inputs["value"] + 1})
+    workflow.chain("double", "increment")
+    return PregelEngine(
+        workflow.build_graph(), StateManager(workflow.initial_state), ErrorHandler()
+    )
+
+
+def test_async_node_execution_handler_is_awaited():
+    engine = _build_engine()
+    seen: list[str] = []
+
+    async def on_node(event: Event) -> None:
+        await asyncio.sleep(0.01)
+        seen.append(event.node_id)
+
+    engine.event_bus.on(EVT_NODE_EXECUTION, on_node)
+    engine.execute()
+
+    assert seen == ["double", "increment"]
+
+
+async def test_emit_many_async_awaits_coroutine_handlers():
+    bus = EventBus()
+    seen: list[str] = []
+
+    async def on_event(event: Event) -> None:
+        seen.append(event.event_type)
+
+    bus.on("a", on_event)
+    bus.on_global(lambda event: seen.append("global"))
+    await bus.emit_many_async([Event("a"), Event("b")])
+
+    assert seen == ["global", "global", "a"]
+
+
+def test_events_are_delivered_when_a_run_fails(monkeypatch):
+    async def give_up(*args, **kwargs):
+        raise RuntimeError("unrecoverable")
+
+    # Async nodes that never await finish without yielding to the event loop
+    async def step(inputs):
+        return {"value": inputs["value"] + 1}
+
+    async def broken(inputs):
+        raise ValueError("boom")
+
+    workflow = Workflow("failing", {"value": 1})
+    workflow.add_node("first", step)
+    workflow.add_node("second", step)
+    workflow.add_node("broken", broken)
+    workflow.chain("first", "second", "broken")
+    engine = PregelEngine(
+        workflow.build_graph(), StateManager(workflow.initial_state), ErrorHandler()
+    )
+    monkeypatch.setattr(ErrorHandler, "handle_error_async", give_up)
+    supersteps: list[int] = []
+    engine.event_bus.on(EVT_SUPERSTEP, lambda event: supersteps.append(event.superstep))
+
+    with pytest.raises(RuntimeError):
+        engine.execute()
+
+    # Start and end of supersteps 0 and 1, then the start of superstep 2
+    assert supersteps == [0, 0, 1, 1, 2]
+
+
+def test_queued_events_are_stamped_at_emit_time():
+    marks: dict[str, float] = {}
+
+    async def first(inputs):
+        return {"value": 1}
+
+    async def last(inputs):
+        marks["last"] = time.monotonic()
+        return {"value": 2}
+
+    workflow = Workflow("stamps", {"value": 0})
+    workflow.add_node("first", first)
+    workflow.add_node("last", last)
+    workflow.chain("first", "last")
+    engine = PregelEngine(
+        workflow.build_graph(), StateManager(workflow.initial_state), ErrorHandler()
+    )
+    stamps: dict[str, float] = {}
+    engine.event_bus.on(
+        EVT_NODE_EXECUTION,
+        lambda event: stamps.setdefault(event.node_id, event.timestamp),
+    )
+    engine.execute()
+
+    assert stamps["first"] < marks["last"]
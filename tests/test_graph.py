@@ -0,0 +1,132 @@
+"""Tests for graph routing and graph algorithms."""
+
+from __future__ import annotations
+
+import pytest
+
+from lite_workflow.definitions.edge import ConditionalEdge, Edge, condition, when
+from lite_workflow.definitions.graph import Graph
+from lite_workflow.definitions.node import create_function_node
+
+
+def _graph(edges: list[Edge], start: str = "s", graph_id: str = "g") -> Graph:
+    node_ids = dict.fromkeys(
+        [start] + [node_id for e in edges for node_id in (e.source_id, e.target_id)]
+    )
+    nodes = [create_function_node(node_id, lambda inputs: {}) for node_id in node_ids]
+    return Graph(graph_id, nodes, edges, start)
+
+
+def test_routing_follows_edge_declaration_order():
+    graph = _graph(
+        [
+            ConditionalEdge("s", "x", when("r", "X")),
+            ConditionalEdge("s", "y", when("r", "Y")),
+            ConditionalEdge("s", "z", when("r", "X")),
+            Edge("s", "y"),
+        ]
+    )
+
+    assert graph.next_targets("s", {"r": "X"}, None) == ["x", "z", "y"]
+    assert graph.compile()["s"]({"r": "X"}, None) == ["x", "z", "y"]
+
+
+def _reference_targets(graph: Graph, node_id: str, outputs: dict) -> list[str]:
+    return [
+        edge.target_id
+        for edge in graph.get_outgoing_edges(node_id)
+        if edge.should_traverse(outputs, None)
+    ]
+
+
+def test_compiled_routers_match_edge_order_routing():
+    graph = _graph(
+        [
+            Edge("s", "a"),
+            ConditionalEdge("s", "b", when("k", 1)),
+            ConditionalEdge("s", "c", when("k", [1])),
+            ConditionalEdge("s", "d", condition(lambda outputs, state: "d" in outputs)),
+            Edge("s", "e"),
+            ConditionalEdge("a", "b", when("k", 1)),
+        ]
+    )
+    routers = graph.compile()
+
+    for outputs in ({}, {"k": 1}, {"k": [1]}, {"k": 2, "d": True}):
+        for node_id in graph.nodes:
+            expected = _reference_targets(graph, node_id, outputs)
+            assert routers[node_id](outputs, None) == expected
+            assert graph.next_targets(node_id, outputs, None) == expected
+
+
+def test_branch_table_falls_back_for_unhashable_values():
+    graph = _graph(
+        [
+            Edge("s", "a"),
+            ConditionalEdge("s", "b", when("k", 1)),
+            ConditionalEdge("s", "c", when("k", 2)),
+            ConditionalEdge("s", "d", when("k", 1)),
+        ]
+    )
+    route = graph.compile()["s"]
+
+    assert "s" in graph._branch_tables
+    assert route({"k": 1}, None) == ["a", "b", "d"]
+    assert route({"k": 3}, None) == ["a"]
+    # An unhashable output value cannot be looked up; edges are checked in turn
+    assert route({"k": [1]}, None) == ["a"]
+    assert route({"k": _UnhashableOne()}, None) == ["a", "b", "d"]
+
+
+class _UnhashableOne:
+    __hash__ = None
+
+    def __eq__(self, other):
+        return other == 1
+
+
+def test_can_reach_on_dag():
+    graph = _graph([Edge("s", "a"), Edge("a", "b"), Edge("s", "c")])
+
+    assert graph.can_reach("s", "b")
+    assert graph.can_reach("a", "a")
+    assert not graph.can_reach("b", "s")
+    assert not graph.can_reach("c", "b")
+    assert not graph.can_reach("s", "missing")
+
+
+def test_can_reach_on_cyclic_graph():
+    graph = _graph([Edge("s", "a"), Edge("a", "b"), Edge("b", "a"), Edge("b", "c")])
+
+    assert graph.can_reach("b", "a")
+    assert graph.can_reach("a", "c")
+    assert not graph.can_reach("c", "a")
+    assert not graph.can_reach("a", "s")
+
+
+def test_topological_layers_for_diamond():
+    graph = _graph([Edge("s", "a"), Edge("s", "b"), Edge("a", "t"), Edge("b", "t")])
+
+    assert graph.topological_layers() == [["s"], ["a", "b"], ["t"]]
+
+
+def test_topological_layers_raises_on_cycle():
+    graph = _graph([Edge("s", "a"), Edge("a", "s")])
+
+    with pytest.raises(ValueError):
+        graph.topological_layers()
+
+
+def test_topological_sort_on_cyclic_graph():
+    graph = _graph([Edge("s", "a"), Edge("a", "b"), Edge("b", "a"), Edge("s", "c")])
+
+    # Nodes on or after the cycle follow the ordered ones in insertion order
+    assert graph.topological_sort() == ["s", "c", "a", "b"]
+    with pytest.raises(ValueError):
+        graph.topological_sort(strict=True)
+
+
+def test_topological_sort_on_dag():
+    graph = _graph([Edge("s", "b"), Edge("a", "b"), Edge("s", "a")])
+
+    assert graph.topological_sort(strict=True) == ["s", "a", "b"]
@@ -0,0 +1,33 @@
+"""Tests for message serialization."""
+
+from __future__ import annotations
+
+import dataclasses
+
+import pytest
+
+from lite_workflow.definitions.message import Message, messages_to_payload
+
+
+def test_to_dict_returns_independent_copies():
+    message = Message("user", "x", name="n")
+    message.to_dict()["content"] = "X"
+
+    assert message.to_dict() == {"role": "user", "content": "x", "name": "n"}
+    assert messages_to_payload([message]) == [message.to_dict()]
+
+
+def test_message_is_immutable_and_cache_is_not_a_field():
+    message = Message("user", "x")
+    message.to_dict()
+
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        message.content = "y"
+    assert [f.name for f in dataclasses.fields(Message)] == [
+        "role",
+        "content",
+        "name",
+        "tool_calls",
+        "tool_call_id",
+        "metadata",
+    ]
@@ -0,0 +1,70 @@
+"""Tests for StateManager reads and writes."""
+
+from __future__ import annotations
+
+import pytest
+
+from lite_workflow.core.event_bus import EVT_STATE_BATCH_UPDATE, EventBus
+from lite_workflow.core.state_manager import BatchStateUpdateEvent, StateManager
+from lite_workflow.definitions.state import InMemoryState, SlottedState, UpdateStrategy
+
+
+def test_slotted_state_membership():
+    keys = ["k0", "k1"]
+    manager = StateManager({"k0": 1}, schema=keys)
+    state = manager.get_state()
+
+    assert isinstance(state, SlottedState)
+    assert "k0" in state
+    assert "k1" not in state
+    assert "missing" not in state
+
+
+def test_slotted_state_is_rebuilt_only_after_writes():
+    manager = StateManager({"k0": 1}, schema=["k0", "k1"])
+    state = manager.get_state()
+
+    assert manager.get_state() is state
+    manager.set("k1", 2)
+    assert manager.get_state() is not state
+    assert manager.get_state()["k1"] == 2
+
+    manager.set("other", 3)
+    assert isinstance(manager.get_state(), InMemoryState)
+
+
+def test_raise_strategy_rejects_whole_update():
+    manager = StateManager({"a": 1})
+
+    with pytest.raises(KeyError):
+        manager.update({"b": 2, "a": 3}, strategy=UpdateStrategy.RAISE)
+    assert dict(manager.snapshot()) == {"a": 1}
+
+    manager.update({"b": 2}, strategy=UpdateStrategy.RAISE)
+    assert dict(manager.snapshot()) == {"a": 1, "b": 2}
+
+
+def test_ignore_strategy_keeps_existing_keys():
+    manager = StateManager({"a": 1})
+    manager.update({"a": 2, "b": 3}, strategy=UpdateStrategy.IGNORE)
+
+    assert dict(manager.snapshot()) == {"a": 1, "b": 3}
+
+
+def test_update_many_publishes_once_with_one_event_per_source():
+    bus = EventBus()
+    events: list[BatchStateUpdateEvent] = []
+    bus.on(EVT_STATE_BATCH_UPDATE, events.append)
+    manager = StateManager({"a": 0}, event_bus=bus)
+    version = manager.version
+
+    manager.update_many(
+        [({"a": 1, "b": 1}, "first"), ({}, "empty"), ({"a": 2}, "second")]
+    )
+
+    assert manager.version == version + 1
+    assert dict(manager.snapshot()) == {"a": 2, "b": 1}
+    assert [(e.source, e.changes) for e in events] == [
+        ("first", [("a", 0, 1), ("b", None, 1)]),
+        ("second", [("a", 1, 2)]),
+    ]
@@ -7,10 +7,10 @@ import subprocess
 import sys
 import os
 
-def run_command(cmd, cwd=None):
-    """Run a command and return the result."""
+def run_command(cmd, cwd=None, shell=False):
+    """Run a command (an argument list unless ``shell``) and return the result."""
     try:
-        result = subprocess.run(cmd, shell=True, capture_output=True, text=True, cwd=cwd)
+        result = subprocess.run(cmd, shell=shell, capture_output=True, text=True, cwd=cwd)
         return result.returncode == 0, result.stdout, result.stderr
     except Exception as e:
         return False, "", str(e)
@@ -20,13 +20,13 @@ def setup_uv_environment():
     print("🚀 Setting up UV environment...")
     
     # Check if uv is installed
-    success, stdout, stderr = run_command("uv --version")
+    success, stdout, stderr = run_command(["uv", "--version"])
     if not success:
         print("❌ UV not found. Installing...")
         
         # Install uv
         install_cmd = "curl -LsSf https://astral.sh/uv/install.sh | sh"
-        success, stdout, stderr = run_command(install_cmd)
+        success, stdout, stderr = run_command(install_cmd, shell=True)
         if not success:
             print(f"❌ Failed to install uv: {stderr}")
             return False
@@ -35,7 +35,7 @@ def setup_uv_environment():
     
     # Create virtual environment
     print("📦 Creating virtual environment...")
-    success, stdout, stderr = run_command("uv venv")
+    success, stdout, stderr = run_command(["uv", "venv"])
     if not success:
         print(f"❌ Failed to create venv: {stderr}")
         return False
@@ -44,7 +44,7 @@ def setup_uv_environment():
     
     # Install dependencies
     print("📥 Installing dependencies...")
-    success, stdout, stderr = run_command("uv pip install -e .")
+    success, stdout, stderr = run_command(["uv", "pip", "install", "-e", "."])
     if not success:
         print(f"❌ Failed to install dependencies: {stderr}")
         return False
@@ -53,7 +53,7 @@ def setup_uv_environment():
     
     # Install openai
     print("📥 Installing OpenAI...")
-    success, stdout, stderr = run_command("uv pip install openai typing-extensions")
+    success, stdout, stderr = run_command(["uv", "pip", "install", "openai", "typing-extensions"])
     if not success:
         print(f"❌ Failed to install OpenAI: {stderr}")
         return False